@@ -3,15 +3,43 @@ Command-line interface for the market maker system.
 Provides easy access to database monitoring and log information.
 """
 # Standard library imports
+import os
+
 import click
-import pandas as pd
 from .utils.db_decorator import with_monitor
+from .utils.df_output import write_df
 from .utils.logging_config import LOGS_DIR
 
-# Set pandas display options for better CLI output
-pd.set_option('display.max_rows', None)
-pd.set_option('display.max_columns', None)
-pd.set_option('display.width', None)
+def _print_df(df, title, empty_msg):
+    """Print a titled DataFrame, or a message if it is empty."""
+    if df.empty:
+        click.echo(empty_msg)
+        return
+    click.echo(f"\n{title}")
+    click.echo("-" * len(title))
+    write_df(df, click.get_text_stream('stdout'))
+
+def _tail(path, n, block_size=8192):
+    """Return the last n lines of a file, reading backwards from the end.
+
+    Only the trailing blocks that contain those lines are read, so the cost
+    depends on the number of lines requested rather than the file size.
+    """
+    if n <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        buf = b''
+        newlines = 0
+        while size > 0 and newlines <= n:
+            block = min(block_size, size)
+            size -= block
+            f.seek(size)
+            chunk = f.read(block)
+            newlines += chunk.count(b'\n')
+            buf = chunk + buf
+    return [line.decode('utf-8', errors='replace') for line in buf.splitlines()[-n:]]
 
 @click.group()
 def cli():
@@ -32,7 +60,9 @@ def stats(monitor):
 @with_monitor
 def recent(monitor, minutes):
     """Show recent snapshots."""
-    snapshots = monitor.get_recent_snapshots(minutes=minutes)
+    snapshots = monitor.iter_recent_snapshots(
+        minutes=minutes,
+        columns=('timestamp', 'spread_name', 'old_midpoint', 'new_midpoint'))
     click.echo(f"\nRecent Snapshots (last {minutes} minutes):")
     click.echo("----------------------------------------")
     for snap in snapshots:
@@ -45,39 +75,27 @@ def recent(monitor, minutes):
 @with_monitor
 def history(monitor, spread_name, hours):
     """Show price history for a specific spread."""
-    df = monitor.get_spread_history(spread_name, hours=hours)
-    if df.empty:
-        click.echo(f"No history found for spread {spread_name}")
-        return
-    click.echo(f"\nPrice History for {spread_name} (last {hours} hours):")
-    click.echo("------------------------------------------------")
-    click.echo(df.to_string())
+    _print_df(monitor.get_spread_history(spread_name, hours=hours),
+              f"Price History for {spread_name} (last {hours} hours):",
+              f"No history found for spread {spread_name}")
 
 @cli.command()
 @click.option('--top-n', default=10, help='Number of largest moves to show')
 @with_monitor
 def moves(monitor, top_n):
     """Show largest price moves."""
-    df = monitor.get_largest_moves(top_n=top_n)
-    if df.empty:
-        click.echo("No price moves found")
-        return
-    click.echo(f"\nTop {top_n} Largest Price Moves:")
-    click.echo("---------------------------")
-    click.echo(df.to_string())
+    _print_df(monitor.get_largest_moves(top_n=top_n),
+              f"Top {top_n} Largest Price Moves:",
+              "No price moves found")
 
 @cli.command()
 @click.option('--hours', default=24, help='Number of hours to look back')
 @with_monitor
 def summary(monitor, hours):
     """Show summary of all spreads activity."""
-    df = monitor.get_spread_summary(hours=hours)
-    if df.empty:
-        click.echo("No spread activity found")
-        return
-    click.echo(f"\nSpread Activity Summary (last {hours} hours):")
-    click.echo("----------------------------------------")
-    click.echo(df.to_string())
+    _print_df(monitor.get_spread_summary(hours=hours),
+              f"Spread Activity Summary (last {hours} hours):",
+              "No spread activity found")
 
 @cli.command()
 @click.option('--lines', default=50, help='Number of lines to show')
@@ -96,9 +114,8 @@ def logs(lines, component):
         return
     click.echo(f"\nRecent {component} logs (last {lines} lines):")
     click.echo("----------------------------------------")
-    with open(log_file, encoding='utf-8') as f:
-        for line in list(f)[-lines:]:
-            click.echo(line.strip())
+    for line in _tail(log_file, lines):
+        click.echo(line.strip())
 
 if __name__ == '__main__':
     cli() 
\ No newline at end of file
@@ -3,7 +3,6 @@ Configuration settings for the market maker system.
 All configurable parameters are centralized here for easy modification.
 """
 from pathlib import Path
-import os
 
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -45,6 +44,7 @@ POLL_INTERVAL = 5  # seconds between Excel polls
 INTERNAL_CHECK_INTERVAL = 1  # seconds between internal price checks
 STABILITY_DURATION = 4  # seconds price must remain stable
 STARTUP_DELAY = 10  # seconds to wait before starting
+STATS_LOG_INTERVAL = 300  # minimum seconds between database stats log entries
 
 # Trading hours
 TRADING_START_TIME = "07:00"
@@ -55,7 +55,4 @@ MIN_PRICE_CHANGE = 0.01  # minimum price change to log
 
 # Database settings
 DB_PATH = PROJECT_ROOT / "data" / "market_maker.db"
-ENABLE_WAL = True  # Write-Ahead Logging for better performance
-
-# Create data directory if it doesn't exist
-os.makedirs(DB_PATH.parent, exist_ok=True) 
\ No newline at end of file
+ENABLE_WAL = True  # Write-Ahead Logging for better performance 
\ No newline at end of file
@@ -3,23 +3,25 @@ Main application module for the market maker system.
 Coordinates data capture, processing, and storage.
 """
 # Standard library imports
+import logging
 import signal
 import sys
 import time
 
-# Third-party imports
-import schedule
-
 # Local imports
 from .data.excel_reader import ExcelReader
 from .data.models import Session
-from .utils.time_utils import is_trading_hours
+from .utils.time_utils import is_trading_hours, seconds_until
 from .utils.logging_config import main_logger
+from .utils.db_indexes import ensure_indexes
 from .utils.db_monitor import DatabaseMonitor
 from .config.settings import (
     INTERNAL_CHECK_INTERVAL,
     STABILITY_DURATION,
-    STARTUP_DELAY
+    DB_PATH,
+    STARTUP_DELAY,
+    STATS_LOG_INTERVAL,
+    TRADING_START_TIME
 )
 
 class MarketMaker:
@@ -34,6 +36,7 @@ class MarketMaker:
         self.last_snapshot_time = None
         self.stable_count = 0
         self.stability_threshold = STABILITY_DURATION / INTERNAL_CHECK_INTERVAL
+        self._last_stats_log = None
         self.logger = main_logger
 
         # Set up signal handlers
@@ -55,7 +58,8 @@ class MarketMaker:
         Implements the stability logic and minimum change threshold.
         """
         if not is_trading_hours():
-            self.logger.debug("Outside trading hours, skipping snapshot")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Outside trading hours, skipping snapshot")
             return
 
         try:
@@ -68,11 +72,12 @@ class MarketMaker:
             # Check stability
             if self.excel_reader.has_stable_midpoints(midpoints):
                 self.stable_count += 1
-                self.logger.debug("Prices stable for %(count)s checks", 
-                                {'count': self.stable_count})
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Prices stable for %d checks", self.stable_count)
             else:
                 self.stable_count = 0
-                self.logger.debug("Price change detected, resetting stability counter")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Price change detected, resetting stability counter")
                 return
 
             if self.stable_count >= self.stability_threshold:
@@ -82,39 +87,54 @@ class MarketMaker:
                 # Implementation will be expanded here
 
                 # Log database stats periodically
-                stats = self.db_monitor.get_database_stats()
-                self.logger.info("Database stats after snapshot: %(stats)s", 
-                               {'stats': stats})
+                now = time.monotonic()
+                if (self._last_stats_log is None
+                        or now - self._last_stats_log >= STATS_LOG_INTERVAL):
+                    stats = self.db_monitor.get_database_stats()
+                    self.logger.info("Database stats after snapshot: %s", stats)
+                    self._last_stats_log = now
 
                 self.stable_count = 0
 
         except Exception as e:
-            self.logger.error("Error processing snapshot: %(error)s", 
-                              {'error': str(e)}, exc_info=True)
+            self.logger.error("Error processing snapshot: %s", e, exc_info=True)
 
     def run(self) -> None:
         """
         Main run loop of the market maker system.
         """
-        self.logger.info("Starting market maker system in %(delay)s seconds...",
-                        {'delay': STARTUP_DELAY})
+        self.logger.info("Starting market maker system in %s seconds...", STARTUP_DELAY)
         time.sleep(STARTUP_DELAY)
 
-        # Schedule the main processing job
-        schedule.every(INTERNAL_CHECK_INTERVAL).seconds.do(self.process_snapshot)
-
         self.logger.info("Market maker system is running. Press Ctrl+C to stop.")
 
+        # Deadlines advance by a fixed interval so the loop only wakes when
+        # a check is due and timing does not drift with processing time
+        next_run = time.monotonic()
         while self.running:
-            schedule.run_pending()
-            idle = schedule.idle_seconds()
-            if idle is None or idle <= 0:
-                idle = 0.1
-            time.sleep(idle)
+            if not is_trading_hours():
+                # Nothing to do until the market opens, so sleep straight through
+                sleep_secs = seconds_until(TRADING_START_TIME)
+                self.logger.info("Outside trading hours, sleeping %.0f seconds until %s",
+                                 sleep_secs, TRADING_START_TIME)
+                time.sleep(sleep_secs)
+                next_run = time.monotonic()
+                continue
+
+            now = time.monotonic()
+            if now >= next_run:
+                self.process_snapshot()
+                next_run += INTERNAL_CHECK_INTERVAL
+                if next_run < now:
+                    # Fell more than a full interval behind; skip missed checks
+                    next_run = now + INTERNAL_CHECK_INTERVAL
+            time.sleep(max(0, next_run - time.monotonic()))
 
 def main():
     """Entry point for the market maker system."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     market_maker = MarketMaker()
+    ensure_indexes(market_maker.session.get_bind())
     market_maker.run()
 
 if __name__ == "__main__":
@@ -1,11 +1,45 @@
-from market_maker.utils.db_monitor import DatabaseMonitor
+import atexit
 from functools import wraps
 
+# Monitor shared by every decorated call for the lifetime of the process
+_monitor = None
+
+
+def _get_monitor():
+    """Return the shared DatabaseMonitor, creating it on first use."""
+    global _monitor  # pylint: disable=global-statement
+    if _monitor is None:
+        # Imported here so decorating a function does not pull in pandas/SQLAlchemy
+        from market_maker.config.settings import DB_PATH  # pylint: disable=import-outside-toplevel
+        from market_maker.utils.db_monitor import DatabaseMonitor  # pylint: disable=import-outside-toplevel
+        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _monitor = DatabaseMonitor()
+        atexit.register(_close_monitor)
+    return _monitor
+
+
+def _close_monitor():
+    """Close the shared monitor's session."""
+    global _monitor  # pylint: disable=global-statement
+    if _monitor is not None:
+        _monitor.session.close()
+        _monitor = None
+
 
 def with_monitor(func):
-    """Decorator that provides a DatabaseMonitor to the decorated function."""
+    """Decorator that provides a DatabaseMonitor to the decorated function.
+
+    The monitor (and its session/connection) is shared across calls; each call
+    ends its own transaction, committing on success and rolling back on error.
+    """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        with DatabaseMonitor() as monitor:
-            return func(monitor, *args, **kwargs)
-    return wrapper 
\ No newline at end of file
+        monitor = _get_monitor()
+        try:
+            result = func(monitor, *args, **kwargs)
+        except Exception:
+            monitor.session.rollback()
+            raise
+        monitor.session.commit()
+        return result
+    return wrapper
@@ -0,0 +1,40 @@
+"""
+Secondary indexes on the snapshots table used by the monitoring queries.
+"""
+from sqlalchemy import Index, inspect
+from sqlalchemy.schema import CreateIndex
+
+from market_maker.data.models import Snapshot
+
+# A snapshot is only worth showing if one of its prices moved; the partial
+# index keeps just those rows, ordered by time, for show_recent_captures
+PRICE_CHANGED = ((Snapshot.old_midpoint != Snapshot.new_midpoint) |
+                 (Snapshot.old_bid != Snapshot.new_bid) |
+                 (Snapshot.old_ask != Snapshot.new_ask))
+CHANGED_TIMESTAMP_INDEX = Index('ix_snapshots_changed_timestamp', Snapshot.timestamp,
+                                sqlite_where=PRICE_CHANGED, postgresql_where=PRICE_CHANGED)
+# Indexes the midpoint change expression so DatabaseMonitor.get_largest_moves
+# reads the top N moves from the index instead of sorting the whole table
+MIDPOINT_CHANGE_INDEX = Index('ix_snapshots_midpoint_change',
+                              Snapshot.new_midpoint - Snapshot.old_midpoint)
+# Time-window lookups by DatabaseMonitor: one spread's history, and all
+# snapshots since a cutoff (recent snapshots, spread summary)
+SPREAD_TIMESTAMP_INDEX = Index('ix_snapshots_spread_timestamp', Snapshot.spread_name, Snapshot.timestamp)
+TIMESTAMP_INDEX = Index('ix_snapshots_timestamp', Snapshot.timestamp)
+SNAPSHOT_INDEXES = (CHANGED_TIMESTAMP_INDEX, MIDPOINT_CHANGE_INDEX, SPREAD_TIMESTAMP_INDEX, TIMESTAMP_INDEX)
+
+
+def ensure_indexes(engine):
+    """Create any snapshot indexes the database does not have yet.
+
+    Run from the entry points that write snapshots, never from read-only
+    viewers: the DDL takes a write lock and can take a while on a large table.
+    Does nothing if the snapshots table has not been created.
+    """
+    if not inspect(engine).has_table(Snapshot.__tablename__):
+        return
+    # Expression indexes can't be reflected for checkfirst, so let the database
+    # skip indexes that already exist
+    with engine.begin() as conn:
+        for index in SNAPSHOT_INDEXES:
+            conn.execute(CreateIndex(index, if_not_exists=True))
@@ -1,106 +1,128 @@
 """
 Database monitoring utilities for the market maker system.
 Provides functions to query and monitor database state.
+
+pandas is only imported by the methods that return DataFrames, so the
+capture loop's statistics logging does not pay for it at startup.
 """
-from typing import List, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence
 from datetime import datetime, timedelta
-import pandas as pd
 from sqlalchemy import select, func
 from ..data.models import Snapshot, Session
 from .logging_config import db_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class DatabaseMonitor:
     """
     Utility class for monitoring and querying the database.
     Provides methods to view recent changes and database statistics.
     """
     def __init__(self, session: Optional[Session] = None):
-        self.session = session or Session()
+        # The monitor only reads, so its own session never needs to flush before
+        # a query or reload attributes after a commit
+        self.session = session or Session(autoflush=False, expire_on_commit=False)
         self.logger = db_logger
 
-    def get_recent_snapshots(self, minutes: int = 5) -> List[Snapshot]:
-        """Get snapshots from the last N minutes."""
-        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
-        query = select(Snapshot).where(Snapshot.timestamp >= cutoff_time)
+    def iter_recent_snapshots(self, minutes: int = 5,
+                              columns: Optional[Sequence[str]] = None) -> Iterator[Snapshot]:
+        """Yield snapshots from the last N minutes, fetched in batches.
 
-        snapshots = self.session.execute(query).scalars().all()
+        With `columns`, only those Snapshot attributes are selected and plain
+        rows with the same attribute names are yielded instead of ORM objects.
+        """
+        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
+        if columns:
+            query = select(*(getattr(Snapshot, name) for name in columns))
+        else:
+            query = select(Snapshot)
+        query = query.where(Snapshot.timestamp >= cutoff_time).execution_options(yield_per=500)
+        result = self.session.execute(query)
+        yield from (result if columns else result.scalars())
+
+    def get_recent_snapshots(self, minutes: int = 5,
+                             columns: Optional[Sequence[str]] = None) -> List[Snapshot]:
+        """Get snapshots from the last N minutes as a list.
+
+        See iter_recent_snapshots for `columns`; callers that only loop over
+        the snapshots once should use that instead.
+        """
+        snapshots = list(self.iter_recent_snapshots(minutes, columns))
         self.logger.info("Retrieved %(count)s snapshots from last %(minutes)s minutes",
                         {'count': len(snapshots), 'minutes': minutes})
         return snapshots
 
     def get_spread_history(self, spread_name: str, hours: int = 24) -> pd.DataFrame:
         """Get price history for a specific spread."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel,redefined-outer-name
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        query = select(Snapshot).where(
+        # Select just the columns needed so rows skip ORM object construction
+        query = select(
+            Snapshot.timestamp,
+            Snapshot.old_midpoint.label('old_mid'),
+            Snapshot.new_midpoint.label('new_mid'),
+            Snapshot.old_bid,
+            Snapshot.new_bid,
+            Snapshot.old_ask,
+            Snapshot.new_ask
+        ).where(
             Snapshot.spread_name == spread_name,
             Snapshot.timestamp >= cutoff_time
         )
 
-        snapshots = self.session.execute(query).scalars().all()
+        result = self.session.execute(query)
+        rows = result.all()
 
         # Convert to DataFrame for easier analysis
-        if not snapshots:
+        if not rows:
             self.logger.warning("No history found for spread %(spread)s",
                               {'spread': spread_name})
             return pd.DataFrame()
 
-        data = {
-            'timestamp': [s.timestamp for s in snapshots],
-            'old_mid': [s.old_midpoint for s in snapshots],
-            'new_mid': [s.new_midpoint for s in snapshots],
-            'old_bid': [s.old_bid for s in snapshots],
-            'new_bid': [s.new_bid for s in snapshots],
-            'old_ask': [s.old_ask for s in snapshots],
-            'new_ask': [s.new_ask for s in snapshots]
-        }
-
-        df = pd.DataFrame(data)
+        df = pd.DataFrame.from_records(rows, columns=list(result.keys()))
         self.logger.info("Retrieved %(count)s historical records for %(spread)s",
                         {'count': len(df), 'spread': spread_name})
         return df
 
     def get_database_stats(self) -> dict:
         """Get general database statistics."""
+        # All four aggregates come from a single query and round trip
         # pylint: disable=not-callable
-        stats = {
-            'total_snapshots': self.session.scalar(select(func.count(Snapshot.id))),
-            'unique_spreads': self.session.scalar(
-                select(func.count(func.distinct(Snapshot.spread_name)))
-            ),
-            'oldest_record': self.session.scalar(
-                select(func.min(Snapshot.timestamp))
-            ),
-            'newest_record': self.session.scalar(
-                select(func.max(Snapshot.timestamp))
-            )
-        }
+        query = select(
+            func.count(Snapshot.id).label('total_snapshots'),
+            func.count(func.distinct(Snapshot.spread_name)).label('unique_spreads'),
+            func.min(Snapshot.timestamp).label('oldest_record'),
+            func.max(Snapshot.timestamp).label('newest_record')
+        )
+        stats = dict(self.session.execute(query).mappings().one())
 
         self.logger.info("Database stats: %(stats)s", {'stats': stats})
         return stats
 
     def get_largest_moves(self, top_n: int = 10) -> pd.DataFrame:
         """Get the largest price moves in the database."""
-        query = select(Snapshot).order_by(
-            (Snapshot.new_midpoint - Snapshot.old_midpoint).desc()
-        ).limit(top_n)
-
-        moves = self.session.execute(query).scalars().all()
-
-        data = {
-            'timestamp': [m.timestamp for m in moves],
-            'spread': [m.spread_name for m in moves],
-            'old_mid': [m.old_midpoint for m in moves],
-            'new_mid': [m.new_midpoint for m in moves],
-            'change': [m.new_midpoint - m.old_midpoint for m in moves]
-        }
-
-        df = pd.DataFrame(data)
+        import pandas as pd  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        change = (Snapshot.new_midpoint - Snapshot.old_midpoint).label('change')
+        query = select(
+            Snapshot.timestamp,
+            Snapshot.spread_name.label('spread'),
+            Snapshot.old_midpoint.label('old_mid'),
+            Snapshot.new_midpoint.label('new_mid'),
+            change
+        ).order_by(change.desc()).limit(top_n)
+
+        result = self.session.execute(query)
+        df = pd.DataFrame.from_records(result.all(), columns=list(result.keys()))
         self.logger.info("Retrieved top %(top_n)s largest price moves",
                         {'top_n': top_n})
         return df
 
     def get_spread_summary(self, hours: int = 24) -> pd.DataFrame:
         """Get a summary of all spreads' activity."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel,redefined-outer-name
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
         # pylint: disable=not-callable
         query = select(
@@ -0,0 +1,41 @@
+"""
+Plain-text output of DataFrames for the command-line tools.
+"""
+import sys
+
+
+def _as_text(values, precision):
+    """Return a Series' values as strings, floats rounded to `precision` places like to_string."""
+    if values.dtype.kind != 'f':
+        return values.astype(str)
+    return values.round(precision).astype(str).where(values.notna(), 'NaN')
+
+
+def _max_len(text):
+    """Return the length of the longest string in `text`, 0 if it is empty."""
+    return int(text.str.len().max()) if len(text) else 0
+
+
+def write_df(df, stream=None, chunk=1000):
+    """Write a DataFrame as a fixed-width table, `chunk` rows at a time.
+
+    Column widths are measured over the whole frame before anything is
+    written, so every chunk lines up under the single header without the
+    whole table being rendered as one string. Floats follow pandas'
+    display.precision option, as they do in to_string.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+    precision = pd.get_option('display.precision')
+    out = sys.stdout if stream is None else stream
+    columns = range(df.shape[1])
+    names = [str(name) for name in df.columns]
+    index_width = _max_len(_as_text(df.index.to_series(), precision))
+    widths = [max(len(name), _max_len(_as_text(df.iloc[:, i], precision))) for i, name in zip(columns, names)]
+
+    out.write("  ".join([" " * index_width] + [name.rjust(w) for name, w in zip(names, widths)]) + "\n")
+    for start in range(0, len(df), chunk):
+        part = df.iloc[start:start + chunk]
+        labels = [label.ljust(index_width) for label in _as_text(part.index.to_series(), precision).tolist()]
+        cells = [[value.rjust(w) for value in _as_text(part.iloc[:, i], precision).tolist()]
+                 for i, w in zip(columns, widths)]
+        out.write("".join("  ".join(row) + "\n" for row in zip(labels, *cells)))
@@ -1,22 +1,50 @@
 """
 Logging configuration for the market maker system.
 Implements both file and console logging with different levels.
+
+Loggers only enqueue records; formatting, file writes and rotation happen on
+a background QueueListener thread so logging stays off the polling path.
 """
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 
-# Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
 
 # Create separate log files for different components
 MAIN_LOG = LOGS_DIR / "market_maker.log"
 DB_LOG = LOGS_DIR / "database.log"
 EXCEL_LOG = LOGS_DIR / "excel_reader.log"
 
+def _create_console_handler():
+    """Create the console handler shared by all component loggers."""
+    console_formatter = logging.Formatter(
+        '%(asctime)s | %(levelname)-8s | %(message)s',
+        datefmt='%H:%M:%S'
+    )
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(logging.INFO)
+    return console_handler
+
+class _LazyDirRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler that creates the log directory when the file is first opened."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+# Single queue and listener thread shared by every logger
+_log_queue = queue.Queue(-1)
+_listener = QueueListener(_log_queue, _create_console_handler(),
+                          respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
 def setup_logger(name: str, log_file: Path, level=logging.INFO):
     """Set up a logger with both file and console handlers."""
     level_env = os.getenv("MARKET_MAKER_LOG_LEVEL")
@@ -37,28 +65,22 @@ def setup_logger(name: str, log_file: Path, level=logging.INFO):
         '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    console_formatter = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
 
-    # File handler (rotating log file)
-    file_handler = RotatingFileHandler(
+    # File handler (rotating log file and its directory, created on first write)
+    file_handler = _LazyDirRotatingFileHandler(
         log_file,
         maxBytes=10*1024*1024,  # 10MB
-        backupCount=5
+        backupCount=5,
+        delay=True
     )
     file_handler.setFormatter(file_formatter)
     file_handler.setLevel(logging.DEBUG)
+    # The listener is shared, so only write this logger's records to its file
+    file_handler.addFilter(logging.Filter(name))
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(console_formatter)
-    console_handler.setLevel(logging.INFO)
-
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand the file handler to the listener thread; the logger itself only enqueues
+    _listener.handlers = _listener.handlers + (file_handler,)
+    logger.addHandler(QueueHandler(_log_queue))
 
     return logger
 
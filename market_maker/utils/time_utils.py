@@ -4,9 +4,10 @@ Time-related utility functions for the market maker system.
 This module provides utilities for:
 - Parsing time strings into time objects
 - Checking if current time is within trading hours
+- Computing the time remaining until a given time of day
 - Formatting timestamps for logging
 """
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from ..config.settings import TRADING_START_TIME, TRADING_END_TIME
 
 def parse_time(time_str: str) -> time:
@@ -24,6 +25,10 @@ def parse_time(time_str: str) -> time:
     """
     return datetime.strptime(time_str, "%H:%M").time()
 
+# Trading hours are fixed for the lifetime of the process, so parse them once
+_TRADING_START = parse_time(TRADING_START_TIME)
+_TRADING_END = parse_time(TRADING_END_TIME)
+
 def is_trading_hours() -> bool:
     """Check if current time is within trading hours.
 
@@ -34,10 +39,22 @@ def is_trading_hours() -> bool:
         bool: True if current time is within trading hours
     """
     current_time = datetime.now().time()
-    start_time = parse_time(TRADING_START_TIME)
-    end_time = parse_time(TRADING_END_TIME)
+    return _TRADING_START <= current_time <= _TRADING_END
+
+def seconds_until(time_str: str) -> float:
+    """Get the number of seconds until the next occurrence of a time of day.
 
-    return start_time <= current_time <= end_time
+    Args:
+        time_str: Time string in "HH:MM" format
+
+    Returns:
+        float: Seconds until that time today, or tomorrow if it has passed
+    """
+    now = datetime.now()
+    target = datetime.combine(now.date(), parse_time(time_str))
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
 
 def format_timestamp(dt: datetime) -> str:
     """Format datetime for logging.
@@ -48,4 +65,9 @@ def format_timestamp(dt: datetime) -> str:
     Returns:
         str: Formatted timestamp string in "YYYY-MM-DD HH:MM:SS" format
     """
+    # isoformat produces the same layout in one C call for the naive datetimes
+    # used throughout; it would append the offset for aware ones, so those
+    # still go through strftime
+    if dt.tzinfo is None:
+        return dt.isoformat(" ", "seconds")
     return dt.strftime("%Y-%m-%d %H:%M:%S")
@@ -5,23 +5,36 @@ Supports both Windows (win32com) and Mac (xlwings) for live Excel reading.
 import os
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from sqlalchemy import event, func, insert, select
 from market_maker.data.models import Session, Snapshot, init_db
-from market_maker.data.prompt_dates import calculate_days_between, get_prompt_date
+from market_maker.data.prompt_dates import calculate_days_between as _calculate_days_between
+from market_maker.data.prompt_dates import get_prompt_date as _get_prompt_date
+from market_maker.utils.db_indexes import PRICE_CHANGED, ensure_indexes
 from datetime import datetime, timedelta
-import pandas as pd
+from collections import OrderedDict
+from dataclasses import dataclass
+import functools
+import itertools
 import platform
+import queue
+import signal
+import threading
 import time
 import os
 import sys
 import math
 import re
-import numpy as np
 import logging
 import argparse
 
 # Add a module-level logger after existing imports
 logger = logging.getLogger(__name__)
 
+# The same few dozen prompt codes recur on every capture, so resolve each
+# once; the caches are cleared whenever the reference dates are refreshed
+get_prompt_date = functools.lru_cache(maxsize=512)(_get_prompt_date)
+calculate_days_between = functools.lru_cache(maxsize=512)(_calculate_days_between)
+
 # ANSI color codes
 GREEN = '\033[32m'
 RED = '\033[31m'
@@ -32,17 +45,138 @@ def color_text(text, color):
     """Add color to text."""
     return f"{color}{text}{RESET}"
 
-# Detect OS and import appropriate Excel interface
+# Prebuilt cells for show_recent_captures rows, picked by the sign of the change
+POS_FMT = f"{GREEN}{{:+8.2f}}{RESET}"
+NEG_FMT = f"{RED}{{:+8.2f}}{RESET}"
+NEU_FMT = "{:+8.2f}"
+NA_PRICE = color_text("   N/A   ", GRAY)
+NA_CHANGE = color_text("  N/A  ", GRAY)
+# Table rules and headers, built once
+CHANGES_HEADER = ("Time                      | Type | A/D | Spread          | Days |"
+                  " Mid Old  | Mid New  |  Mid Δ  |"
+                  " Bid Old  | Bid New  |  Bid Δ  |"
+                  " Ask Old  | Ask New  |  Ask Δ")
+CHANGES_RULE = "-" * 180
+SECTION_HEADER = (f"{'Spread':<15} | {'A/D':^3} | {'Midpoint':>12} | {'Bid':>12} | "
+                  f"{'Ask':>12} | {'Days Between':>12} | {'Dates':>35}")
+SECTION_RULE = "-" * 140
+SNAPSHOT_RULE = "=" * 120
+# Row template and blank price cell for the initial snapshot sections
+SNAPSHOT_ROW_FMT = "{:<15} | {:^3} | {:12.2f} | {} | {} | {:>12} | {:>35}"
+BLANK_PRICE = " " * 12
+# Cells and row template for the live changes table printed by capture_midpoints
+LIVE_POS_FMT = f"{GREEN}{{:^+7.2f}}{RESET}"
+LIVE_NEG_FMT = f"{RED}{{:^+7.2f}}{RESET}"
+LIVE_NEU_FMT = "{:^+7.2f}"
+LIVE_NA_PRICE = color_text("  N/A  ", GRAY)
+LIVE_NA_CHANGE = color_text(" N/A ", GRAY)
+LIVE_ROW_FMT = ("{:<25} | {:^4} | {:^3} | {:<15} | {:>4} | {:^8.2f} | {:^8.2f} | {} | "
+                "{} | {} | {} | {} | {} | {}")
+ROW_FMT = ("{:<25} | {:<15} | {:^3} | {:>4} | {:10.2f} | {:10.2f} | {} | "
+           "{} | {} | {} | {} | {} | {}")
+
+# Detect OS; the matching Excel library is imported when a connection is made
 IS_WINDOWS = platform.system() == 'Windows'
-if IS_WINDOWS:
-    import win32com.client
-else:
-    import xlwings as xw
 
 # Stability settings
 STABILITY_DURATION = 4    # seconds price must remain stable
+STABILITY_TIMEDELTA = timedelta(seconds=STABILITY_DURATION)
 MIN_PRICE_CHANGE = 0.01  # minimum price change to log
 POLL_INTERVAL = 0.5      # seconds between checks
+POLL_TIMEDELTA = timedelta(seconds=POLL_INTERVAL)
+MAX_POLL_INTERVAL = 2.0  # longest poll interval reached while Excel is idle
+POLL_BACKOFF = 1.5       # poll interval growth factor per idle poll
+IDLE_FULL_READ_EVERY = 10  # idle polls skipped without a change event before a read is forced anyway
+PRIMARY_ROWS = range(4, 30)  # Section 1 rows holding the actual (primary) spreads
+FIRST_DATA_ROW = 4  # rows above this are the B2 prefix and column headers
+# (name, first column, data rows) per section; each section spans eight columns:
+# dates and mid, a gap, then Fidessa bid volume/bid/ask/ask volume
+SECTIONS = (
+    ("Section 1", "A", 64),
+    ("Section 2", "Z", 83),
+    ("Section 3", "AW", 81),
+)
+SNAPSHOT_BATCH_SIZE = 1  # queued snapshot rows needed before a capture writes them; raise to batch across polls
+REFERENCE_REFRESH_INTERVAL = 300  # seconds between re-reads of the SOD reference dates
+WRITER_BATCH_SIZE = 500  # most snapshot rows the writer thread commits at once
+WRITER_FLUSH_INTERVAL = 0.5  # seconds the writer thread waits to fill a batch before committing
+WRITER_RETRIES = 3  # further attempts at a failed batch before its rows are dropped
+WRITER_RETRY_DELAY = 0.5  # seconds before the first retry, doubling after each failure
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Use WAL with NORMAL sync so commits skip most fsyncs and readers don't block the writer.
+    
+    Temporary tables (e.g. sorts) stay in memory and each connection keeps a
+    64 MB page cache.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.close()
+
+def insert_snapshots(session, rows):
+    """Insert snapshot row dicts as one executemany of a single Core INSERT.
+    
+    Skips the ORM unit of work entirely; all rows must have the same keys.
+    """
+    if rows:  # An empty parameter list would insert a single row of NULLs
+        session.execute(insert(Snapshot.__table__), rows)
+
+# Spread validation
+_MMM_YY_RE = re.compile(r'^[A-Z]{3}-\d{2}$')  # prompt format, e.g. JAN-25
+_SPECIAL_DATES = frozenset(('C', '3M'))      # cash and 3M legs
+
+@functools.lru_cache(maxsize=256)
+def _fmt_mmm_yy(dt):
+    """Format a datetime as an MMM-YY prompt code (e.g. JAN-25), cached per value."""
+    return dt.strftime("%b-%y").upper()
+
+def _prompt_code(date_val):
+    """Normalise an Excel prompt cell so equal prompts share one string object."""
+    if isinstance(date_val, datetime):
+        return _fmt_mmm_yy(date_val)
+    if isinstance(date_val, str):
+        return sys.intern(date_val)
+    return date_val
+
+@functools.lru_cache(maxsize=4096)
+def _prompt_pair_status(date1, date2):
+    """Classify a prompt pair for is_valid_spread, cached as the same pairs recur every capture.
+    
+    Returns None for JAN-70 placeholders (never valid), otherwise whether the
+    pair itself forms a valid spread.
+    """
+    # Convert datetime objects to strings in MMM-YY format
+    if isinstance(date1, datetime):
+        date1 = _fmt_mmm_yy(date1)
+    if isinstance(date2, datetime):
+        date2 = _fmt_mmm_yy(date2)
+        
+    # Convert dates to strings if they aren't already
+    date1 = str(date1)
+    date2 = str(date2)
+        
+    # Filter out JAN-70 dates (placeholder for NaN/invalid)
+    if 'JAN-70' in date1 or 'JAN-70' in date2:
+        return None
+        
+    # If both dates are special cases ('C' and '3M'), it's invalid
+    if date1 in _SPECIAL_DATES and date2 in _SPECIAL_DATES:
+        return False
+        
+    # If neither date is special, validate the format (MMM-YY)
+    if date1 not in _SPECIAL_DATES and not _MMM_YY_RE.match(date1):
+        return False
+    if date2 not in _SPECIAL_DATES and not _MMM_YY_RE.match(date2):
+        return False
+            
+    # Don't allow spreads between the same dates unless one is a special case
+    if date1 == date2 and date1 not in _SPECIAL_DATES:
+        return False
+        
+    return True
 
 def is_valid_spread(date1, date2, value):
     """
@@ -57,21 +191,11 @@ def is_valid_spread(date1, date2, value):
         bool: True if spread is valid, False otherwise
     """
     # Skip if any of the inputs are None or empty
-    if any(x is None for x in [date1, date2]):
+    if date1 is None or date2 is None:
         return False
-        
-    # Convert datetime objects to strings in MMM-YY format
-    if isinstance(date1, datetime):
-        date1 = date1.strftime("%b-%y").upper()
-    if isinstance(date2, datetime):
-        date2 = date2.strftime("%b-%y").upper()
-        
-    # Convert dates to strings if they aren't already
-    date1 = str(date1) if date1 is not None else ''
-    date2 = str(date2) if date2 is not None else ''
-        
-    # Filter out JAN-70 dates (placeholder for NaN/invalid)
-    if 'JAN-70' in date1 or 'JAN-70' in date2:
+    
+    status = _prompt_pair_status(date1, date2)
+    if status is None:
         return False
         
     # Try to convert value to float and check if it's valid
@@ -83,30 +207,38 @@ def is_valid_spread(date1, date2, value):
     except (ValueError, TypeError):
         return False
         
-    # Special cases for 'C' and '3M'
-    special_dates = ['C', '3M']
-    
-    # If both dates are special cases, it's invalid
-    if date1 in special_dates and date2 in special_dates:
-        return False
-        
-    # If neither date is special, validate the format (MMM-YY)
-    if date1 not in special_dates and not isinstance(date1, datetime):
-        if not re.match(r'^[A-Z]{3}-\d{2}$', date1):
-            return False
-            
-    if date2 not in special_dates and not isinstance(date2, datetime):
-        if not re.match(r'^[A-Z]{3}-\d{2}$', date2):
-            return False
-            
-    # Don't allow spreads between the same dates unless one is a special case
-    if date1 == date2 and date1 not in special_dates:
-        return False
-        
-    return True
+    return status
+
+def _days_between(date1, date2, c_date, three_m_date):
+    """Days between two prompts, measuring C and 3M legs from the given reference dates."""
+    if date1 == 'C' and c_date:
+        date2_obj = get_prompt_date(date2)
+        return abs((date2_obj - c_date).days) if date2_obj else None
+    if date1 == '3M' and three_m_date:
+        date2_obj = get_prompt_date(date2)
+        return abs((date2_obj - three_m_date).days) if date2_obj else None
+    if date2 == '3M' and three_m_date:
+        date1_obj = get_prompt_date(date1)
+        return abs((three_m_date - date1_obj).days) if date1_obj else None
+    return calculate_days_between(date1, date2)
+
+def _leg_dates(date1, date2, c_date, three_m_date):
+    """Resolve a spread's two legs to dates, taking C and 3M legs from the reference dates."""
+    if date1 == 'C' and c_date:
+        return c_date, get_prompt_date(date2)
+    if date1 == '3M' and three_m_date:
+        return three_m_date, get_prompt_date(date2)
+    if date2 == '3M' and three_m_date:
+        return get_prompt_date(date1), three_m_date
+    return get_prompt_date(date1), get_prompt_date(date2)
 
 class PricePoint:
     """Class to track price stability."""
+    __slots__ = ('spread', 'value', 'bid', 'ask', 'bid_volume', 'ask_volume',
+                 'first_seen', 'last_seen', 'unchanged_since', 'stable_at', 'is_stable', 'is_recorded',
+                 'last_recorded_value', 'last_recorded_bid', 'last_recorded_ask',
+                 'is_primary', 'dependency')
+
     def __init__(self, spread, value, timestamp, bid=0.0, ask=0.0, bid_volume=0, ask_volume=0, is_primary=False):
         self.spread = spread
         self.value = self._safe_float_conversion(value)
@@ -117,6 +249,7 @@ class PricePoint:
         self.first_seen = timestamp
         self.last_seen = timestamp
         self.unchanged_since = timestamp
+        self.stable_at = timestamp + STABILITY_TIMEDELTA  # When the current price counts as stable
         self.is_stable = False  # Start as unstable
         self.is_recorded = False  # Track if we've recorded this value
         self.last_recorded_value = self._safe_float_conversion(value)  # Initialize with current value
@@ -127,10 +260,10 @@ class PricePoint:
 
     def _safe_float_conversion(self, value):
         """Safely convert a value to float, handling various types."""
-        if value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return float(value)
+        try:
+            return value + 0.0  # Fast path: Excel values are almost always numbers already
+        except TypeError:
+            pass
         if isinstance(value, str):
             try:
                 return float(value)
@@ -141,13 +274,18 @@ class PricePoint:
     def update(self, value, timestamp, bid=None, ask=None, bid_volume=None, ask_volume=None, dependency=None):
         """Update price point with new values."""
         try:
-            current_value = self._safe_float_conversion(value)
+            try:
+                current_value = value + 0.0
+            except TypeError:
+                current_value = self._safe_float_conversion(value)
             current_bid = self._safe_float_conversion(bid) if bid is not None else self.bid
             current_ask = self._safe_float_conversion(ask) if ask is not None else self.ask
             
-            logger.debug(f"Updating PricePoint for spread {self.spread}: current_value={current_value}, previous_value={self.value}")
-            logger.debug(f"Bid: current_bid={current_bid}, previous_bid={self.bid}, diff={(abs(self.bid - current_bid) if self.bid is not None and current_bid is not None else 'N/A')}")
-            logger.debug(f"Ask: current_ask={current_ask}, previous_ask={self.ask}, diff={(abs(self.ask - current_ask) if self.ask is not None and current_ask is not None else 'N/A')}")
+            # Only build the debug lines when they will be logged; this runs for every row
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Updating PricePoint for spread {self.spread}: current_value={current_value}, previous_value={self.value}")
+                logger.debug(f"Bid: current_bid={current_bid}, previous_bid={self.bid}, diff={(abs(self.bid - current_bid) if self.bid is not None and current_bid is not None else 'N/A')}")
+                logger.debug(f"Ask: current_ask={current_ask}, previous_ask={self.ask}, diff={(abs(self.ask - current_ask) if self.ask is not None and current_ask is not None else 'N/A')}")
             
             # Update volumes without tracking changes
             if bid_volume is not None:
@@ -185,6 +323,7 @@ class PricePoint:
                 self.bid = current_bid
                 self.ask = current_ask
                 self.unchanged_since = timestamp
+                self.stable_at = timestamp + STABILITY_TIMEDELTA
                 self.is_stable = False
                 self.is_recorded = False  # Reset recorded flag on significant change
                 if dependency:
@@ -194,9 +333,8 @@ class PricePoint:
                 # Price hasn't changed significantly
                 self.last_seen = timestamp
                 # Check if price has been stable for required duration
-                stability_duration = (timestamp - self.unchanged_since).total_seconds()
                 was_stable = self.is_stable
-                self.is_stable = stability_duration >= STABILITY_DURATION
+                self.is_stable = timestamp >= self.stable_at
                 # Return True only when we first become stable and haven't recorded yet
                 return (self.is_stable and not was_stable and not self.is_recorded), (self.last_recorded_value, self.last_recorded_bid, self.last_recorded_ask)
         except Exception as e:
@@ -210,8 +348,18 @@ class PricePoint:
         self.last_recorded_bid = self.bid  # Update last recorded bid
         self.last_recorded_ask = self.ask  # Update last recorded ask
 
+    def save_state(self):
+        """Return the tracked fields so a failed capture can put them back."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def restore_state(self, state):
+        """Restore fields returned by save_state."""
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
 def format_date(date_val):
     """Format date value to MMM-YY format."""
+    import pandas as pd  # Only needed here, so keep it off the script's startup path
     if pd.isna(date_val):
         return None
     try:
@@ -231,15 +379,37 @@ def format_date(date_val):
             date_val = pd.to_datetime(date_val)
             
         # Format to MMM-YY
-        return date_val.strftime("%b-%y").upper()
+        return _fmt_mmm_yy(date_val)
             
     except Exception as e:
         print(f"Warning: Could not format date {date_val}: {e}")
         return None
 
+class _WorkbookEvents:
+    """COM event sink that reports workbook edits and recalculations."""
+    callback = None
+    wake_handle = None  # win32 event signalled alongside the callback
+
+    def OnSheetChange(self, sheet, target):
+        self._notify()
+
+    def OnSheetCalculate(self, sheet):
+        self._notify()
+
+    def _notify(self):
+        if self.callback:
+            self.callback()
+        if self.wake_handle is not None:
+            import win32event
+            win32event.SetEvent(self.wake_handle)
+
 class ExcelInterface:
     """Abstract base class for Excel interfaces."""
     def __init__(self):
+        self._events = None  # Workbook event sink, set by watch_changes
+        self._wake_handle = None  # win32 event that ends wait_for_change early, set by watch_changes
+        self._ctrl_handler = None  # Console control handler registered by watch_changes
+        self._ranges = {}  # (sheet id, start cell, rows, cols) -> (sheet, Range object), reused across reads
         if IS_WINDOWS:
             self.setup_windows()
         else:
@@ -247,6 +417,7 @@ class ExcelInterface:
     
     def setup_windows(self):
         """Setup Windows COM interface."""
+        import win32com.client
         try:
             self.excel = win32com.client.GetObject(None, "Excel.Application")
             self.wb = None
@@ -265,6 +436,7 @@ class ExcelInterface:
     
     def setup_mac(self):
         """Setup Mac xlwings interface."""
+        import xlwings as xw
         try:
             # First try to get existing Excel instance
             apps = xw.apps
@@ -296,63 +468,124 @@ class ExcelInterface:
             print("3. You have necessary permissions")
             raise
     
+    def watch_changes(self, callback):
+        """Call `callback` whenever the workbook is edited or recalculated.
+        
+        Change events are only available through COM on Windows. Returns
+        False where they are unsupported, in which case callers just poll.
+        """
+        if not IS_WINDOWS:
+            return False
+        import win32api
+        import win32com.client
+        import win32event
+        try:
+            self._wake_handle = win32event.CreateEvent(None, False, False, None)
+            self._events = win32com.client.WithEvents(self.wb, _WorkbookEvents)
+            self._events.callback = callback
+            self._events.wake_handle = self._wake_handle
+            # Ctrl+C must also end a wait blocked in MsgWaitForMultipleObjects
+            self._ctrl_handler = self._on_console_ctrl
+            win32api.SetConsoleCtrlHandler(self._ctrl_handler, True)
+            return True
+        except Exception as e:
+            print(f"Warning: Excel change events unavailable, polling only: {e}")
+            self.unwatch_changes()
+            return False
+    
+    def unwatch_changes(self):
+        """Stop the change events started by watch_changes and release their handles."""
+        if self._ctrl_handler is not None:
+            import win32api
+            win32api.SetConsoleCtrlHandler(self._ctrl_handler, False)
+            self._ctrl_handler = None
+        if self._events is not None:
+            self._events.close()  # Disconnects the COM event sink
+            self._events = None
+        if self._wake_handle is not None:
+            self._wake_handle.Close()
+            self._wake_handle = None
+    
+    def _on_console_ctrl(self, ctrl_type):
+        """Console control handler: wake the waiting thread, then let Python raise SIGINT."""
+        import win32event
+        win32event.SetEvent(self._wake_handle)
+        return False
+    
+    def wait_for_change(self, wake, timeout):
+        """Wait up to `timeout` seconds, returning early once `wake` is set.
+        
+        COM events are only delivered while this thread pumps messages, so when
+        watching for changes the thread blocks until a message arrives, the wake
+        handle is signalled (change event or Ctrl+C) or the timeout passes, and
+        only pumps when there are messages.
+        Returns True if `wake` was set, False if the wait timed out.
+        """
+        if self._events is not None:
+            import pythoncom
+            import win32event
+            deadline = time.monotonic() + timeout
+            while not wake.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                result = win32event.MsgWaitForMultipleObjects(
+                    [self._wake_handle], False, math.ceil(remaining * 1000), win32event.QS_ALLINPUT)
+                if result != win32event.WAIT_OBJECT_0 + 1:
+                    break  # Wake handle signalled or timed out
+                pythoncom.PumpWaitingMessages()  # Delivers the COM events, which set `wake`
+            win32event.ResetEvent(self._wake_handle)  # Already handled via `wake`
+        else:
+            wake.wait(timeout)
+        woken = wake.is_set()
+        wake.clear()
+        return woken
+    
     def read_range(self, sheet, start_cell, nrows, ncols):
-        """Read a range of values from Excel sheet."""
+        """Read a block of values from Excel sheet in a single call.
+
+        Returns a sequence of rows as Excel provides them (a tuple of tuples on
+        Windows, lists via xlwings): numbers arrive as floats and empty cells
+        as None on both, so the block is used without copying. An empty mid
+        therefore fails is_valid_spread and its row is skipped, as it was when
+        capture read each cell with read_cell. The Range object for each block
+        is created once and reused, so repeat reads only fetch values.
+        """
         try:
-            # Parse start cell (e.g., 'A1' -> row 1, col 'A')
-            start_col = start_cell[0].upper()
-            if len(start_cell) > 2 and start_cell[1].isalpha():  # Handle 'AA4' style references
-                start_col = start_cell[:2].upper()
-                start_row = int(start_cell[2:])
-            else:
-                start_row = int(start_cell[1:])
+            key = (id(sheet), start_cell, nrows, ncols)
+            cached = self._ranges.get(key)
+            if cached is None:
+                # Holding the sheet keeps its id from being reused by another sheet
+                cached = self._ranges[key] = (sheet, self._block_range(sheet, start_cell, nrows, ncols))
+            rng = cached[1]
             
             if IS_WINDOWS:
-                # Windows COM range reading
-                end_col = chr(ord(start_col[-1]) + ncols - 1)
-                end_row = start_row + nrows - 1
-                range_address = f"{start_cell}:{end_col}{end_row}"
-                values = sheet.Range(range_address).Value
-                if isinstance(values, tuple):
-                    values = [list(row) for row in values]
-                elif not isinstance(values, list):
-                    values = [[values]]
-            else:
-                # xlwings range reading - read row by row for more reliability
-                values = []
-                for row in range(nrows):
-                    row_values = []
-                    for col in range(ncols):
-                        # Calculate column letter
-                        if len(start_col) == 1:
-                            col_letter = chr(ord(start_col) + col)
-                        else:
-                            # Handle double letter columns (AA, AB, etc)
-                            base = ord('Z') - ord('A') + 1
-                            first = chr(ord('A') + ((ord(start_col[0]) - ord('A')) * base + col) // base)
-                            second = chr(ord('A') + ((ord(start_col[0]) - ord('A')) * base + col) % base)
-                            col_letter = f"{first}{second}"
-                        
-                        cell_ref = f"{col_letter}{start_row + row}"
-                        try:
-                            value = sheet.range(cell_ref).value
-                            # Convert numeric values to float, handle None
-                            if value is None:
-                                value = 0.0
-                            elif isinstance(value, (int, float)):
-                                value = float(value)
-                            row_values.append(value)
-                        except Exception as e:
-                            print(f"Warning: Error reading cell {cell_ref}: {e}")
-                            row_values.append(0.0)
-                    values.append(row_values)
-            
-            return values
+                values = rng.Value
+                if not isinstance(values, tuple):
+                    values = ((values,),)
+                return values
+            return rng.value
             
         except Exception as e:
             print(f"Error reading range starting at {start_cell}: {e}")
             # Return empty list with correct dimensions
-            return [[0.0] * ncols for _ in range(nrows)]
+            return [[None] * ncols for _ in range(nrows)]
+    
+    def _block_range(self, sheet, start_cell, nrows, ncols):
+        """Create the Range object covering nrows x ncols from start_cell."""
+        from openpyxl.utils import column_index_from_string, get_column_letter
+        # Split start cell into column letters and row (e.g. 'AA4' -> 'AA', 4)
+        split = len(start_cell.rstrip('0123456789'))
+        start_col = start_cell[:split].upper()
+        start_row = int(start_cell[split:])
+        
+        end_col = get_column_letter(column_index_from_string(start_col) + ncols - 1)
+        end_row = start_row + nrows - 1
+        range_address = f"{start_col}{start_row}:{end_col}{end_row}"
+        
+        if IS_WINDOWS:
+            return sheet.Range(range_address)
+        return sheet.range(range_address).options(ndim=2)
     
     def read_cell(self, sheet, cell):
         """Read a single cell value."""
@@ -370,14 +603,93 @@ class ExcelInterface:
             print(f"Error reading cell {cell}: {e}")
             return None
 
+class SnapshotWriter:
+    """Background thread that commits queued snapshot rows in batches.
+    
+    The capture loop only hands rows over; the writer collects them for up to
+    WRITER_FLUSH_INTERVAL seconds or WRITER_BATCH_SIZE rows and writes each
+    batch with one bulk insert on its own session, so commits never hold up a poll.
+    """
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="snapshot-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, rows):
+        """Queue a list of snapshot row dicts for the writer thread."""
+        if rows:
+            self._queue.put(rows)
+    
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        self._stop.set()
+        self._thread.join()
+    
+    def _next_batch(self):
+        """Collect queued rows until the batch is full or the flush interval ends."""
+        batch = []
+        deadline = time.monotonic() + WRITER_FLUSH_INTERVAL
+        while len(batch) < WRITER_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.extend(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+    
+    def _run(self):
+        session = Session()
+        try:
+            while not (self._stop.is_set() and self._queue.empty()):
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                self._write(session, batch)
+        finally:
+            session.close()
+    
+    def _write(self, session, batch):
+        """Insert and commit one batch, retrying with backoff before dropping it."""
+        delay = WRITER_RETRY_DELAY
+        for attempt in range(WRITER_RETRIES + 1):
+            start = time.perf_counter()
+            try:
+                insert_snapshots(session, batch)
+                session.commit()
+            except Exception:
+                session.rollback()
+                if attempt == WRITER_RETRIES:
+                    logger.exception("Dropping %d snapshot rows after %d failed writes",
+                                     len(batch), attempt + 1)
+                    return
+                logger.warning("Writing %d snapshot rows failed, retrying in %.1f seconds",
+                               len(batch), delay, exc_info=True)
+                time.sleep(delay)
+                delay *= 2
+                continue
+            logger.debug("Inserted %d snapshots in %.3f seconds",
+                         len(batch), time.perf_counter() - start)
+            return
+
 class ExcelMonitor:
     """Class to maintain Excel connection and track prices."""
     def __init__(self):
-        self.price_tracker = {}
+        self.price_tracker = {}  # (prompt1, prompt2) -> PricePoint
         self.session = Session()
+        self._pending_snapshots = []  # Snapshot rows queued for the next bulk insert
+        self.writer = None  # SnapshotWriter that commits rows in the background, if any
+        self._recent_primary = OrderedDict()  # Unrecorded primary spread -> time it last changed, oldest first
+        self._last_raw = {}  # Raw (date1, date2) -> (row values, tracker key, PricePoint, mid) from the last processing
+        self.last_active_rows = 0  # Rows that changed or were still settling in the last capture
+        self.verbose = True  # Print the table of recorded changes after each capture
         self.excel = None
         self.c_date = None  # Store C (cash) date
         self.three_m_date = None  # Store 3M date
+        self._last_ref_refresh = None  # Monotonic time the reference dates were last read
+        self._days_cache = {}  # (prompt1, prompt2) -> days between, reset with the reference dates
         self.spread_prefix = None  # Store spread prefix from B2
         self.connect_to_excel()
         self.update_reference_dates()
@@ -424,18 +736,37 @@ class ExcelMonitor:
             
         try:
             # Get reference dates from SOD sheet
+            get_prompt_date.cache_clear()
+            calculate_days_between.cache_clear()
+            self._days_cache.clear()
             self.c_date = self.excel.read_cell(self.excel.sod_sheet, "C8")
             self.three_m_date = self.excel.read_cell(self.excel.sod_sheet, "C9")
             
             if self.c_date is None or self.three_m_date is None:
                 print("\nWarning: Could not read reference dates from SOD sheet")
+            else:
+                self._last_ref_refresh = time.monotonic()
         except Exception as e:
             print(f"\nError reading reference dates: {e}")
     
+    def days_between(self, date1, date2):
+        """Days between a spread's prompts, using the reference dates for C and 3M legs.
+        
+        Results are cached per prompt pair until the reference dates are refreshed.
+        """
+        key = (date1, date2)
+        if key in self._days_cache:
+            return self._days_cache[key]
+        
+        days = _days_between(date1, date2, self.c_date, self.three_m_date)
+        self._days_cache[key] = days
+        return days
+    
     def connect_to_excel(self):
         """Establish connection to Excel."""
         try:
             self.excel = ExcelInterface()
+            self._last_ref_refresh = None  # Re-read reference dates on the new connection
             return True
         except Exception as e:
             print(f"\nError connecting to Excel: {e}")
@@ -452,14 +783,21 @@ class ExcelMonitor:
         return True
     
     def read_excel_data(self):
-        """Read all required data from Excel."""
+        """Read all required data from Excel.
+        
+        Dates come back as {'prompt1': [...], 'prompt2': [...]} and mids as plain
+        lists, one per section.
+        """
         if not self.ensure_excel_connection():
             return None, None, None
             
         try:
-            # Get reference dates
-            c_date = self.excel.read_cell(self.excel.sod_sheet, "C8")
-            three_m_date = self.excel.read_cell(self.excel.sod_sheet, "C9")
+            # Reference dates change once a day, so only re-read them periodically
+            if (self._last_ref_refresh is None
+                    or time.monotonic() - self._last_ref_refresh > REFERENCE_REFRESH_INTERVAL):
+                self.update_reference_dates()
+            c_date = self.c_date
+            three_m_date = self.three_m_date
             
             # If we can't read basic cells, Excel connection might be broken
             if c_date is None or three_m_date is None:
@@ -471,39 +809,13 @@ class ExcelMonitor:
             c_display = c_date.strftime("%d/%m/%Y") if isinstance(c_date, datetime) else str(c_date)
             three_m_display = three_m_date.strftime("%d/%m/%Y") if isinstance(three_m_date, datetime) else str(three_m_date)
             
-            # Read primary section (A-C) column by column
-            primary_dates1 = [row[0] for row in self.excel.read_range(self.excel.sheet, "A4", 64, 1)]
-            primary_dates2 = [row[0] for row in self.excel.read_range(self.excel.sheet, "B4", 64, 1)]
-            primary_mids = [row[0] for row in self.excel.read_range(self.excel.sheet, "C4", 64, 1)]
-            
-            # Read derived1 section (Z-AB) column by column
-            derived1_dates1 = [row[0] for row in self.excel.read_range(self.excel.sheet, "Z4", 83, 1)]
-            derived1_dates2 = [row[0] for row in self.excel.read_range(self.excel.sheet, "AA4", 83, 1)]
-            derived1_mids = [row[0] for row in self.excel.read_range(self.excel.sheet, "AB4", 83, 1)]
-            
-            # Read derived2 section (AW-AY) column by column
-            derived2_dates1 = [row[0] for row in self.excel.read_range(self.excel.sheet, "AW4", 81, 1)]
-            derived2_dates2 = [row[0] for row in self.excel.read_range(self.excel.sheet, "AX4", 81, 1)]
-            derived2_mids = [row[0] for row in self.excel.read_range(self.excel.sheet, "AY4", 81, 1)]
-            
-            # Combine into DataFrames
-            data = {
-                'primary_dates': pd.DataFrame({
-                    'prompt1': primary_dates1,
-                    'prompt2': primary_dates2
-                }),
-                'derived1_dates': pd.DataFrame({
-                    'prompt1': derived1_dates1,
-                    'prompt2': derived1_dates2
-                }),
-                'derived2_dates': pd.DataFrame({
-                    'prompt1': derived2_dates1,
-                    'prompt2': derived2_dates2
-                }),
-                'primary_mids': pd.Series(primary_mids),
-                'derived1_mids': pd.Series(derived1_mids),
-                'derived2_mids': pd.Series(derived2_mids)
-            }
+            # Read each section's date and mid columns as one block and split them
+            data = {}
+            for name, (_, start_col, nrows) in zip(('primary', 'derived1', 'derived2'), SECTIONS):
+                block = self.excel.read_range(self.excel.sheet, f"{start_col}{FIRST_DATA_ROW}", nrows, 3)
+                dates1, dates2, mids = (list(column) for column in zip(*block))
+                data[f'{name}_dates'] = {'prompt1': dates1, 'prompt2': dates2}
+                data[f'{name}_mids'] = mids
             
             return data, (c_display, c_date), (three_m_display, three_m_date)
             
@@ -521,33 +833,81 @@ class ExcelMonitor:
             all_changes = []  # Track all changes for unified sorting and printing
             capture_time = datetime.utcnow()
             
-            # Section 1 (A-C)
-            for row in range(2, 100):  # Adjust range as needed
-                date1 = self.excel.read_cell(self.excel.sheet, f"A{row}")
-                date2 = self.excel.read_cell(self.excel.sheet, f"B{row}")
-                mid = self.excel.read_cell(self.excel.sheet, f"C{row}")
-                
-                self._process_spread_data(date1, date2, mid, seen_spreads, all_changes, capture_time, current_values, row, section=0)
-
-            # Section 2 (Z-AB)
-            for row in range(2, 100):
-                date1 = self.excel.read_cell(self.excel.sheet, f"Z{row}")
-                date2 = self.excel.read_cell(self.excel.sheet, f"AA{row}")
-                mid = self.excel.read_cell(self.excel.sheet, f"AB{row}")
-                
-                self._process_spread_data(date1, date2, mid, seen_spreads, all_changes, capture_time, current_values, row, section=1)
-
-            # Section 3 (AW-AY)
-            for row in range(2, 100):
-                date1 = self.excel.read_cell(self.excel.sheet, f"AW{row}")
-                date2 = self.excel.read_cell(self.excel.sheet, f"AX{row}")
-                mid = self.excel.read_cell(self.excel.sheet, f"AY{row}")
-                
-                self._process_spread_data(date1, date2, mid, seen_spreads, all_changes, capture_time, current_values, row, section=2)
+            # Bind loop invariants to locals once per capture
+            read_range = self.excel.read_range
+            sheet = self.excel.sheet
+            pending = self._pending_snapshots
+            process = self._process_spread_data
+            last_raw = self._last_raw
+            tracker = self.price_tracker
+            active_rows = 0
+            
+            # Each section's data rows are read as one block
+            for section, (_, start_col, nrows) in enumerate(SECTIONS):
+                # A failing section discards its own queued rows and undoes the
+                # tracker updates behind them, so those prices are recorded next time
+                section_start = len(pending)
+                changes_start = len(all_changes)
+                section_active = active_rows
+                recent_primary = self._recent_primary.copy()  # Only holds primaries changed within a poll
+                undo = []  # (raw dates, cached entry, tracker key, point, its saved state, already seen) per processed row
+                try:
+                    rows = read_range(sheet, f"{start_col}{FIRST_DATA_ROW}", nrows, 8)
+                    # Validate the whole block up front so only real spreads reach the per-row path
+                    valid_rows = [(row, values) for row, values in enumerate(rows, start=FIRST_DATA_ROW)
+                                  if is_valid_spread(values[0], values[1], values[2])]
+                    for row, values in valid_rows:
+                        date1, date2, mid, _, *fidessa = values
+                        # Rows identical to last time whose price has already settled need no work
+                        cached = last_raw.get((date1, date2))
+                        if cached is not None and cached[0] == values and cached[2].is_stable:
+                            _, spread_key, point, current_value = cached
+                            if spread_key not in seen_spreads:
+                                point.last_seen = capture_time
+                                current_values[point.spread] = current_value
+                                seen_spreads.add(spread_key)
+                            continue
+                        
+                        if cached is not None:
+                            key, point = cached[1], cached[2]
+                        else:
+                            key = (_prompt_code(date1), _prompt_code(date2))
+                            point = tracker.get(key)
+                        undo.append(((date1, date2), cached, key, point,
+                                     None if point is None else point.save_state(), key in seen_spreads))
+                        result = process(date1, date2, mid, seen_spreads, all_changes, capture_time, current_values, row,
+                                         section=section, fidessa=fidessa)
+                        if result is not None:
+                            last_raw[(date1, date2)] = (values, *result)
+                            active_rows += 1
+                except Exception as e:
+                    print(f"Error capturing section {section + 1}: {e}")
+                    del pending[section_start:]
+                    del all_changes[changes_start:]
+                    active_rows = section_active
+                    self._recent_primary.clear()
+                    self._recent_primary.update(recent_primary)
+                    for raw_key, cached, key, point, state, seen in reversed(undo):
+                        if not seen and key in seen_spreads:
+                            seen_spreads.discard(key)
+                            current_values.pop(tracker[key].spread, None)
+                        if cached is None:
+                            last_raw.pop(raw_key, None)
+                        else:
+                            last_raw[raw_key] = cached
+                        if point is None:
+                            tracker.pop(key, None)
+                        else:
+                            point.restore_state(state)
             
-            # If we have changes, commit them and display in a unified, sorted section
-            if all_changes:
-                self.session.commit()
+            self.last_active_rows = active_rows
+            
+            # Write queued snapshots in a single bulk insert once the batch is full
+            if len(self._pending_snapshots) >= SNAPSHOT_BATCH_SIZE:
+                self.flush_snapshots()
+            
+            # If we have changes, display them in a unified, sorted section
+            if all_changes and self.verbose:
                 
                 # Sort all changes by days first, then spread name
                 def get_days(x):
@@ -559,15 +919,14 @@ class ExcelMonitor:
                 all_changes.sort(key=lambda x: (get_days(x), x[2]))
                 
                 # Print header only once
-                print("\nTime                      | Type | A/D | Spread          | Days |"
-                      " Mid Old  | Mid New  |  Mid Δ  |"
-                      " Bid Old  | Bid New  |  Bid Δ  |"
-                      " Ask Old  | Ask New  |  Ask Δ")
-                print("-" * 180)
+                lines = ["\n" + CHANGES_HEADER, CHANGES_RULE]
+                
+                # Every change in a capture shares its timestamp
+                time_str = capture_time.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
                 
                 # Print all changes
                 for change_data in all_changes:
-                    time, type_, spread, new_value, old_value, dependency, days, spread_type, new_bid, old_bid, new_ask, old_ask = change_data
+                    _, type_, spread, new_value, old_value, dependency, days, spread_type, new_bid, old_bid, new_ask, old_ask = change_data
                     
                     days_str = str(days) if days is not None else "N/A"
                     
@@ -578,220 +937,204 @@ class ExcelMonitor:
                     
                     # Format bid values
                     if math.isnan(new_bid) or math.isnan(old_bid) or (new_bid == 0 and old_bid == 0):
-                        bid_old_str = color_text("  N/A  ", GRAY)
-                        bid_new_str = color_text("  N/A  ", GRAY)
-                        bid_change_str = color_text(" N/A ", GRAY)
+                        bid_old_str = bid_new_str = LIVE_NA_PRICE
+                        bid_change_str = LIVE_NA_CHANGE
                     else:
                         bid_old_str = f"{old_bid:^8.2f}"
                         bid_new_str = f"{new_bid:^8.2f}"
-                        bid_change_str = f"{bid_change:^+7.2f}"
-                        if bid_change > 0:
-                            bid_change_str = color_text(bid_change_str, GREEN)
-                        elif bid_change < 0:
-                            bid_change_str = color_text(bid_change_str, RED)
+                        bid_change_str = (LIVE_POS_FMT if bid_change > 0 else LIVE_NEG_FMT if bid_change < 0 else LIVE_NEU_FMT).format(bid_change)
                     
                     # Format ask values
                     if math.isnan(new_ask) or math.isnan(old_ask) or (new_ask == 0 and old_ask == 0):
-                        ask_old_str = color_text("  N/A  ", GRAY)
-                        ask_new_str = color_text("  N/A  ", GRAY)
-                        ask_change_str = color_text(" N/A ", GRAY)
+                        ask_old_str = ask_new_str = LIVE_NA_PRICE
+                        ask_change_str = LIVE_NA_CHANGE
                     else:
                         ask_old_str = f"{old_ask:^8.2f}"
                         ask_new_str = f"{new_ask:^8.2f}"
-                        ask_change_str = f"{ask_change:^+7.2f}"
-                        if ask_change > 0:
-                            ask_change_str = color_text(ask_change_str, GREEN)
-                        elif ask_change < 0:
-                            ask_change_str = color_text(ask_change_str, RED)
+                        ask_change_str = (LIVE_POS_FMT if ask_change > 0 else LIVE_NEG_FMT if ask_change < 0 else LIVE_NEU_FMT).format(ask_change)
                     
                     # Format mid change
-                    mid_change_str = f"{mid_change:^+7.2f}"
-                    if mid_change > 0:
-                        mid_change_str = color_text(mid_change_str, GREEN)
-                    elif mid_change < 0:
-                        mid_change_str = color_text(mid_change_str, RED)
+                    mid_change_str = (LIVE_POS_FMT if mid_change > 0 else LIVE_NEG_FMT if mid_change < 0 else LIVE_NEU_FMT).format(mid_change)
                     
-                    print(f"{time.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]:<25} |"
-                          f" {type_:^4} |"
-                          f" {spread_type:^3} |"
-                          f" {spread:<15} |"
-                          f" {days_str:>4} |"
-                          f" {old_value:^8.2f} |"
-                          f" {new_value:^8.2f} |"
-                          f" {mid_change_str} |"
-                          f" {bid_old_str} |"
-                          f" {bid_new_str} |"
-                          f" {bid_change_str} |"
-                          f" {ask_old_str} |"
-                          f" {ask_new_str} |"
-                          f" {ask_change_str}")
+                    lines.append(LIVE_ROW_FMT.format(
+                        time_str, type_, spread_type, spread, days_str, old_value, new_value, mid_change_str,
+                        bid_old_str, bid_new_str, bid_change_str, ask_old_str, ask_new_str, ask_change_str))
+                
+                lines.append("")
+                sys.stdout.write("\n".join(lines))
             
             return current_values
         except Exception as e:
             print(f"Error capturing midpoints: {e}")
             self.session.rollback()  # Rollback on error
+            self._pending_snapshots.clear()
             return {}
 
-    def _process_spread_data(self, date1, date2, mid, seen_spreads, all_changes, capture_time, current_values, row, section=0):
-        """Helper method to process spread data from any section."""
+    def flush_snapshots(self):
+        """Write all queued snapshot rows with one bulk insert and commit.
+        
+        With a writer attached the rows are handed to its thread instead.
+        """
+        if not self._pending_snapshots:
+            return
+        if self.writer is not None:
+            self.writer.submit(self._pending_snapshots[:])
+            self._pending_snapshots.clear()
+            return
+        start = time.perf_counter()
+        insert_snapshots(self.session, self._pending_snapshots)
+        self.session.commit()
+        logger.debug("Inserted %d snapshots in %.3f seconds",
+                     len(self._pending_snapshots), time.perf_counter() - start)
+        self._pending_snapshots.clear()
+
+    def _recent_primary_change(self, capture_time):
+        """Return the unrecorded primary spread that changed within the last poll, if any.
+        
+        Entries are kept oldest first, so expired ones are dropped from the front
+        instead of scanning the whole price tracker for every row.
+        """
+        cutoff = capture_time - POLL_TIMEDELTA
+        while self._recent_primary:
+            key, changed_at = next(iter(self._recent_primary.items()))
+            point = self.price_tracker[key]
+            if changed_at >= cutoff and not point.is_recorded:
+                return point.spread
+            self._recent_primary.popitem(last=False)
+        return None
+
+    def _process_spread_data(self, date1, date2, mid, seen_spreads, all_changes, capture_time, current_values, row, section=0, fidessa=None):
+        """Helper method to process spread data from any section.
+        
+        Rows must already have passed is_valid_spread. `fidessa` holds the row's
+        (bid volume, bid, ask, ask volume) cells as read alongside the dates and mid.
+        Returns (tracker key, PricePoint, mid) once the row is processed, else None.
+        """
         # Format dates if they are datetime objects
-        if isinstance(date1, datetime):
-            date1 = date1.strftime("%b-%y").upper()
-        if isinstance(date2, datetime):
-            date2 = date2.strftime("%b-%y").upper()
+        date1 = _prompt_code(date1)
+        date2 = _prompt_code(date2)
         
         # Skip if we've already seen this spread combination
-        spread_key = f"{date1}-{date2}"
+        spread_key = (date1, date2)
         if spread_key in seen_spreads:
             return
         
-        if is_valid_spread(date1, date2, mid):
-            try:
-                current_value = float(mid) if not isinstance(mid, datetime) else 0.0
+        try:
+            current_value = float(mid) if not isinstance(mid, datetime) else 0.0
+            price_point = self.price_tracker.get(spread_key)
+            if price_point is not None:
+                spread = price_point.spread
+            else:
                 spread = self.format_spread_name(date1, date2)  # Use new formatting method
+            
+            # Fidessa data for this row, already read with the section block
+            bid_volume = 0
+            bid_price = 0.0
+            ask_price = 0.0
+            ask_volume = 0
+            
+            try:
+                bid_volume, bid_price, ask_price, ask_volume = fidessa or (None, None, None, None)
                 
-                # Read Fidessa data based on section
-                bid_volume = 0
-                bid_price = 0.0
-                ask_price = 0.0
-                ask_volume = 0
-                
-                try:
-                    if section == 0:
-                        # Section 1: E, F, G, H
-                        bid_volume = self.excel.read_cell(self.excel.sheet, f"E{row}")
-                        bid_price = self.excel.read_cell(self.excel.sheet, f"F{row}")
-                        ask_price = self.excel.read_cell(self.excel.sheet, f"G{row}")
-                        ask_volume = self.excel.read_cell(self.excel.sheet, f"H{row}")
-                    elif section == 1:
-                        # Section 2: AD, AE, AF, AG
-                        bid_volume = self.excel.read_cell(self.excel.sheet, f"AD{row}")
-                        bid_price = self.excel.read_cell(self.excel.sheet, f"AE{row}")
-                        ask_price = self.excel.read_cell(self.excel.sheet, f"AF{row}")
-                        ask_volume = self.excel.read_cell(self.excel.sheet, f"AG{row}")
-                    else:
-                        # Section 3: BA, BB, BC, BD
-                        bid_volume = self.excel.read_cell(self.excel.sheet, f"BA{row}")
-                        bid_price = self.excel.read_cell(self.excel.sheet, f"BB{row}")
-                        ask_price = self.excel.read_cell(self.excel.sheet, f"BC{row}")
-                        ask_volume = self.excel.read_cell(self.excel.sheet, f"BD{row}")
-                    
-                    logger.debug(f"Section {section} row {row}: bid_price={bid_price}, ask_price={ask_price}")
-                    
-                    # Convert to proper types
-                    bid_volume = int(bid_volume) if bid_volume is not None else 0
-                    ask_volume = int(ask_volume) if ask_volume is not None else 0
-                    bid_price = float(bid_price) if bid_price is not None else None
-                    ask_price = float(ask_price) if ask_price is not None else None
-                    
-                except Exception as e:
-                    # Just log the error but continue processing
-                    print(f"Warning: Could not read Fidessa data for {spread}: {e}")
-                
-                # Calculate days between for the spread
-                days = None
-                if date1 == 'C' and self.c_date:
-                    date1_obj = self.c_date
-                    date2_obj = get_prompt_date(date2)
-                    if date2_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                elif date1 == '3M' and self.three_m_date:
-                    date1_obj = self.three_m_date
-                    date2_obj = get_prompt_date(date2)
-                    if date2_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                elif date2 == '3M' and self.three_m_date:
-                    date1_obj = get_prompt_date(date1)
-                    date2_obj = self.three_m_date
-                    if date1_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                else:
-                    days = calculate_days_between(date1, date2)
+                logger.debug("Section %s row %s: bid_price=%s, ask_price=%s", section, row, bid_price, ask_price)
                 
-                # Determine if this is a primary spread (Section 1, rows 4-29)
-                is_primary = section == 0 and 4 <= row <= 29
-                primary_dependency = None
-                spread_type = "A" if is_primary else "D"
+                # Convert to proper types
+                bid_volume = int(bid_volume) if bid_volume is not None else 0
+                ask_volume = int(ask_volume) if ask_volume is not None else 0
+                bid_price = float(bid_price) if bid_price is not None else None
+                ask_price = float(ask_price) if ask_price is not None else None
                 
-                # Check if any primary spreads have changed recently
-                for key, point in self.price_tracker.items():
-                    if point.is_primary and not point.is_recorded and point.unchanged_since >= capture_time - timedelta(seconds=POLL_INTERVAL):
-                        primary_dependency = key
-                        break
+            except Exception as e:
+                # Just log the error but continue processing
+                print(f"Warning: Could not read Fidessa data for {spread}: {e}")
+            
+            # Calculate days between for the spread
+            days = self.days_between(date1, date2)
+            
+            # Determine if this is a primary spread (Section 1, rows 4-29)
+            is_primary = section == 0 and row in PRIMARY_ROWS
+            spread_type = "A" if is_primary else "D"
+            
+            # Check if any primary spreads have changed recently
+            primary_dependency = self._recent_primary_change(capture_time)
+            
+            # Check if this is a new spread or value has changed
+            if price_point is None:
+                # New spread - start tracking but don't show in changes
+                self.price_tracker[spread_key] = PricePoint(spread, current_value, capture_time, 
+                                                      bid=bid_price, ask=ask_price,
+                                                      bid_volume=bid_volume, ask_volume=ask_volume,
+                                                      is_primary=is_primary)
+                if current_value != 0:  # Only record non-zero values
+                    self._pending_snapshots.append({
+                        'timestamp': capture_time,
+                        'spread_name': spread,
+                        'prompt1': date1,
+                        'prompt2': date2,
+                        'old_midpoint': current_value,
+                        'new_midpoint': current_value,
+                        'old_bid': 0.0 if bid_price is None else bid_price,
+                        'new_bid': 0.0 if bid_price is None else bid_price,
+                        'old_ask': 0.0 if ask_price is None else ask_price,
+                        'new_ask': 0.0 if ask_price is None else ask_price
+                    })
+                    self.price_tracker[spread_key].mark_recorded()
+            else:
+                should_record, (old_value, old_bid, old_ask) = price_point.update(
+                    current_value, capture_time,
+                    bid=bid_price, ask=ask_price,
+                    bid_volume=bid_volume, ask_volume=ask_volume,
+                    dependency=primary_dependency
+                )
                 
-                # Check if this is a new spread or value has changed
-                if spread not in self.price_tracker:
-                    # New spread - start tracking but don't show in changes
-                    self.price_tracker[spread] = PricePoint(spread, current_value, capture_time, 
-                                                          bid=bid_price, ask=ask_price,
-                                                          bid_volume=bid_volume, ask_volume=ask_volume,
-                                                          is_primary=is_primary)
-                    if current_value != 0:  # Only record non-zero values
-                        snapshot = Snapshot(
-                            timestamp=capture_time,
-                            spread_name=spread,
-                            prompt1=date1,
-                            prompt2=date2,
-                            old_midpoint=current_value,
-                            new_midpoint=current_value,
-                            old_bid=0.0 if bid_price is None else bid_price,
-                            new_bid=0.0 if bid_price is None else bid_price,
-                            old_ask=0.0 if ask_price is None else ask_price,
-                            new_ask=0.0 if ask_price is None else ask_price
-                        )
-                        self.session.add(snapshot)
-                        self.price_tracker[spread].mark_recorded()
-                else:
-                    price_point = self.price_tracker[spread]
-                    should_record, (old_value, old_bid, old_ask) = price_point.update(
-                        current_value, capture_time,
-                        bid=bid_price, ask=ask_price,
-                        bid_volume=bid_volume, ask_volume=ask_volume,
-                        dependency=primary_dependency
-                    )
-                    
-                    # Check if value has changed significantly
-                    mid_changed = abs(current_value - price_point.last_recorded_value) >= MIN_PRICE_CHANGE
-                    bid_changed = abs(bid_price - price_point.last_recorded_bid) >= MIN_PRICE_CHANGE if bid_price is not None and price_point.last_recorded_bid is not None else False
-                    ask_changed = abs(ask_price - price_point.last_recorded_ask) >= MIN_PRICE_CHANGE if ask_price is not None and price_point.last_recorded_ask is not None else False
-                    
-                    if mid_changed or bid_changed or ask_changed:
-                        # Value has changed significantly
-                        if current_value != 0:  # Only show non-zero values
-                            # Record the change after stability period
-                            if should_record:
-                                # Add dependency info to changes list if this is a derived spread
-                                if not price_point.is_primary and price_point.dependency:
-                                    all_changes.append((capture_time, "CHG", spread, current_value, price_point.last_recorded_value, 
-                                                      price_point.dependency, days, spread_type,
-                                                      bid_price if bid_price is not None else np.nan, price_point.last_recorded_bid if price_point.last_recorded_bid is not None else np.nan,  # Use last recorded bid
-                                                      ask_price if ask_price is not None else np.nan, price_point.last_recorded_ask if price_point.last_recorded_ask is not None else np.nan)) # Use last recorded ask
-                                else:
-                                    all_changes.append((capture_time, "CHG", spread, current_value, price_point.last_recorded_value, 
-                                                      None, days, spread_type,
-                                                      bid_price if bid_price is not None else np.nan, price_point.last_recorded_bid if price_point.last_recorded_bid is not None else np.nan,  # Use last recorded bid
-                                                      ask_price if ask_price is not None else np.nan, price_point.last_recorded_ask if price_point.last_recorded_ask is not None else np.nan)) # Use last recorded ask
-                                
-                                snapshot = Snapshot(
-                                    timestamp=capture_time,
-                                    spread_name=spread,
-                                    prompt1=date1,
-                                    prompt2=date2,
-                                    old_midpoint=price_point.last_recorded_value,
-                                    new_midpoint=current_value,
-                                    old_bid=0.0 if price_point.last_recorded_bid is None else price_point.last_recorded_bid,
-                                    new_bid=0.0 if bid_price is None else bid_price,
-                                    old_ask=0.0 if price_point.last_recorded_ask is None else price_point.last_recorded_ask,
-                                    new_ask=0.0 if ask_price is None else ask_price
-                                )
-                                self.session.add(snapshot)
+                # Check if value has changed significantly
+                mid_changed = abs(current_value - price_point.last_recorded_value) >= MIN_PRICE_CHANGE
+                bid_changed = abs(bid_price - price_point.last_recorded_bid) >= MIN_PRICE_CHANGE if bid_price is not None and price_point.last_recorded_bid is not None else False
+                ask_changed = abs(ask_price - price_point.last_recorded_ask) >= MIN_PRICE_CHANGE if ask_price is not None and price_point.last_recorded_ask is not None else False
                 
-                current_values[spread] = current_value
-                seen_spreads.add(spread_key)
-            except Exception as e:
-                # Only print warning for truly invalid spreads
-                if not isinstance(e, (ValueError, TypeError)):
-                    print(f"Error processing spread {date1}-{date2}: {e}")
+                if mid_changed or bid_changed or ask_changed:
+                    # Value has changed significantly
+                    if current_value != 0:  # Only show non-zero values
+                        # Record the change after stability period
+                        if should_record:
+                            # Add dependency info to changes list if this is a derived spread
+                            if not price_point.is_primary and price_point.dependency:
+                                all_changes.append((capture_time, "CHG", spread, current_value, price_point.last_recorded_value, 
+                                                  price_point.dependency, days, spread_type,
+                                                  bid_price if bid_price is not None else math.nan, price_point.last_recorded_bid if price_point.last_recorded_bid is not None else math.nan,  # Use last recorded bid
+                                                  ask_price if ask_price is not None else math.nan, price_point.last_recorded_ask if price_point.last_recorded_ask is not None else math.nan)) # Use last recorded ask
+                            else:
+                                all_changes.append((capture_time, "CHG", spread, current_value, price_point.last_recorded_value, 
+                                                  None, days, spread_type,
+                                                  bid_price if bid_price is not None else math.nan, price_point.last_recorded_bid if price_point.last_recorded_bid is not None else math.nan,  # Use last recorded bid
+                                                  ask_price if ask_price is not None else math.nan, price_point.last_recorded_ask if price_point.last_recorded_ask is not None else math.nan)) # Use last recorded ask
+                            
+                            self._pending_snapshots.append({
+                                'timestamp': capture_time,
+                                'spread_name': spread,
+                                'prompt1': date1,
+                                'prompt2': date2,
+                                'old_midpoint': price_point.last_recorded_value,
+                                'new_midpoint': current_value,
+                                'old_bid': 0.0 if price_point.last_recorded_bid is None else price_point.last_recorded_bid,
+                                'new_bid': 0.0 if bid_price is None else bid_price,
+                                'old_ask': 0.0 if price_point.last_recorded_ask is None else price_point.last_recorded_ask,
+                                'new_ask': 0.0 if ask_price is None else ask_price
+                            })
+            
+            # Remember primaries that changed this cycle so derived spreads can find them
+            point = self.price_tracker[spread_key]
+            if point.is_primary and not point.is_recorded and point.unchanged_since == capture_time:
+                self._recent_primary[spread_key] = capture_time
+                self._recent_primary.move_to_end(spread_key)
+            
+            current_values[spread] = current_value
+            seen_spreads.add(spread_key)
+            return spread_key, point, current_value
+        except Exception as e:
+            # Only print warning for truly invalid spreads
+            if not isinstance(e, (ValueError, TypeError)):
+                print(f"Error processing spread {date1}-{date2}: {e}")
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -800,7 +1143,7 @@ def clear_screen():
 def print_full_snapshot(monitor, capture_time):
     """Print a full snapshot of all sections."""
     print("\nInitial Market Snapshot at", capture_time.strftime("%Y-%m-%d %H:%M:%S"))
-    print("=" * 120)  # Widened to accommodate new columns
+    print(SNAPSHOT_RULE)
     
     # Print reference dates if available
     if monitor.c_date and monitor.three_m_date:
@@ -808,67 +1151,36 @@ def print_full_snapshot(monitor, capture_time):
         print(f"C (Cash): {monitor.c_date.strftime('%Y-%m-%d') if isinstance(monitor.c_date, datetime) else monitor.c_date}")
         print(f"3M:      {monitor.three_m_date.strftime('%Y-%m-%d') if isinstance(monitor.three_m_date, datetime) else monitor.three_m_date}")
     
-    sections = [
-        ("Section 1", "A", "B", "C", "E", "F", "G", "H"),  # Added Fidessa columns
-        ("Section 2", "Z", "AA", "AB", "AD", "AE", "AF", "AG"),  # Added Fidessa columns
-        ("Section 3", "AW", "AX", "AY", "BA", "BB", "BC", "BD")  # Added Fidessa columns
-    ]
+    # Bind loop invariants to locals once
+    c_date = monitor.c_date
+    three_m_date = monitor.three_m_date
+    tracker = monitor.price_tracker
+    format_spread_name = monitor.format_spread_name
+    days_between = monitor.days_between
+    initial_rows = []  # Initial snapshots, written with one bulk insert at the end
     
     # Initialize price points for monitoring without waiting for stability
-    for section_idx, (section_name, col1, col2, col3, bid_vol_col, bid_col, ask_col, ask_vol_col) in enumerate(sections):
-        print(f"\n{section_name}")
-        print("-" * 140)  # Increased width
-        print(f"{'Spread':<15} | {'A/D':^3} | {'Midpoint':>12} | {'Bid':>12} | {'Ask':>12} | {'Days Between':>12} | {'Dates':>35}")
-        print("-" * 140)  # Increased width
+    for section_idx, (section_name, start_col, nrows) in enumerate(SECTIONS):
+        # Each section is collected and written out in one go
+        lines = [f"\n{section_name}", SECTION_RULE, SECTION_HEADER, SECTION_RULE]
         
-        for row in range(4, 100):  # Start from row 4 where data begins
-            date1 = monitor.excel.read_cell(monitor.excel.sheet, f"{col1}{row}")
-            date2 = monitor.excel.read_cell(monitor.excel.sheet, f"{col2}{row}")
-            mid = monitor.excel.read_cell(monitor.excel.sheet, f"{col3}{row}")
-            
-            # Read Fidessa data
-            bid_volume = monitor.excel.read_cell(monitor.excel.sheet, f"{bid_vol_col}{row}")
-            bid_price = monitor.excel.read_cell(monitor.excel.sheet, f"{bid_col}{row}")
-            ask_price = monitor.excel.read_cell(monitor.excel.sheet, f"{ask_col}{row}")
-            ask_volume = monitor.excel.read_cell(monitor.excel.sheet, f"{ask_vol_col}{row}")
-            
+        # Read the whole section in one call
+        rows = monitor.excel.read_range(monitor.excel.sheet, f"{start_col}{FIRST_DATA_ROW}", nrows, 8)
+        for row, (date1, date2, mid, _, bid_volume, bid_price, ask_price, ask_volume) in enumerate(rows, start=FIRST_DATA_ROW):
             if is_valid_spread(date1, date2, mid):
                 # Format spread name using new format
-                spread = monitor.format_spread_name(date1, date2)
+                spread = format_spread_name(date1, date2)
                 
                 # Determine if this is an actual spread (only in Section 1, rows 4-29)
-                spread_type = "A" if section_idx == 0 and 4 <= row <= 29 else "D"
+                spread_type = "A" if section_idx == 0 and row in PRIMARY_ROWS else "D"
                 
-                # Calculate days between prompts
-                days = None
+                # Calculate days between prompts, showing the leg dates when known
+                days = days_between(date1, date2)
                 dates_str = ""
-                
-                # Handle special cases with C and 3M
-                if date1 == 'C' and monitor.c_date:
-                    date1_obj = monitor.c_date
-                    date2_obj = get_prompt_date(date2)  # This will now return third Wednesday
-                    if date2_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                        dates_str = f"{date1_obj.strftime('%Y-%m-%d')} → {date2_obj.strftime('%Y-%m-%d')}"
-                elif date1 == '3M' and monitor.three_m_date:
-                    date1_obj = monitor.three_m_date
-                    date2_obj = get_prompt_date(date2)  # This will now return third Wednesday
-                    if date2_obj:
-                        days = abs((date2_obj - date1_obj).days)
+                if days is not None:
+                    date1_obj, date2_obj = _leg_dates(date1, date2, c_date, three_m_date)
+                    if date1_obj and date2_obj:
                         dates_str = f"{date1_obj.strftime('%Y-%m-%d')} → {date2_obj.strftime('%Y-%m-%d')}"
-                elif date2 == '3M' and monitor.three_m_date:
-                    date1_obj = get_prompt_date(date1)  # This will now return third Wednesday
-                    date2_obj = monitor.three_m_date
-                    if date1_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                        dates_str = f"{date1_obj.strftime('%Y-%m-%d')} → {date2_obj.strftime('%Y-%m-%d')}"
-                else:
-                    days = calculate_days_between(date1, date2)  # This already uses third Wednesdays
-                    if days is not None:
-                        date1_obj = get_prompt_date(date1)  # This will now return third Wednesday
-                        date2_obj = get_prompt_date(date2)  # This will now return third Wednesday
-                        if date1_obj and date2_obj:
-                            dates_str = f"{date1_obj.strftime('%Y-%m-%d')} → {date2_obj.strftime('%Y-%m-%d')}"
                 
                 days_str = str(days) if days is not None else "N/A"
                 
@@ -877,258 +1189,194 @@ def print_full_snapshot(monitor, capture_time):
                 ask_price = float(ask_price) if ask_price is not None else None
                 
                 # Format bid/ask display - show empty space when no volume
-                bid_display = f"{bid_price:12.2f}" if bid_price is not None else " " * 12
-                ask_display = f"{ask_price:12.2f}" if ask_price is not None else " " * 12
+                bid_display = f"{bid_price:12.2f}" if bid_price is not None else BLANK_PRICE
+                ask_display = f"{ask_price:12.2f}" if ask_price is not None else BLANK_PRICE
                 
-                print(f"{spread:<15} | {spread_type:^3} | {float(mid):12.2f} | {bid_display} | {ask_display} | {days_str:>12} | {dates_str:>35}")
+                mid_value = float(mid)
+                lines.append(SNAPSHOT_ROW_FMT.format(spread, spread_type, mid_value, bid_display,
+                                                     ask_display, days_str, dates_str))
                 
                 # Initialize price point for monitoring but mark as recorded
-                if spread not in monitor.price_tracker:
+                key = (_prompt_code(date1), _prompt_code(date2))
+                if key not in tracker:
                     price_point = PricePoint(spread, mid, capture_time, 
                                           bid=bid_price, ask=ask_price,
                                           bid_volume=bid_volume, ask_volume=ask_volume,
                                           is_primary=spread_type == "A")
                     price_point.mark_recorded()  # Mark as recorded so we don't show it again immediately
-                    monitor.price_tracker[spread] = price_point
+                    tracker[key] = price_point
                     
-                    # Record initial snapshot in database
-                    snapshot = Snapshot(
-                        timestamp=capture_time,
-                        spread_name=spread,
-                        prompt1=date1,
-                        prompt2=date2,
-                        old_midpoint=float(mid),
-                        new_midpoint=float(mid),
-                        old_bid=0.0 if bid_price is None else bid_price,
-                        new_bid=0.0 if bid_price is None else bid_price,
-                        old_ask=0.0 if ask_price is None else ask_price,
-                        new_ask=0.0 if ask_price is None else ask_price
-                    )
-                    monitor.session.add(snapshot)
+                    # Record initial snapshot in database; old and new sides are the same values
+                    bid_value = 0.0 if bid_price is None else bid_price
+                    ask_value = 0.0 if ask_price is None else ask_price
+                    initial_rows.append({
+                        'timestamp': capture_time,
+                        'spread_name': spread,
+                        'prompt1': date1,
+                        'prompt2': date2,
+                        'old_midpoint': mid_value,
+                        'new_midpoint': mid_value,
+                        'old_bid': bid_value,
+                        'new_bid': bid_value,
+                        'old_ask': ask_value,
+                        'new_ask': ask_value
+                    })
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    # Commit all initial snapshots
-    monitor.session.commit()
-    print("\n" + "=" * 120)  # Widened to accommodate new columns
+    # Write all initial snapshots in one explicit transaction, committed on exit
+    with monitor.session.begin(), monitor.session.no_autoflush:
+        insert_snapshots(monitor.session, initial_rows)
+    print("\n" + SNAPSHOT_RULE)
+
+@dataclass(frozen=True)
+class RefDates:
+    """Reference data the read-only views need from the workbook."""
+    c_date: datetime = None
+    three_m_date: datetime = None
+    actual_spreads: frozenset = frozenset()  # (prompt1, prompt2) of the Section 1 spreads
+    
+    def days_between(self, date1, date2):
+        """Days between a spread's prompts, using the reference dates for C and 3M legs.
+        
+        The prompt date lookups behind this are already cached at module level.
+        """
+        return _days_between(date1, date2, self.c_date, self.three_m_date)
+
+@functools.lru_cache(maxsize=1)
+def load_ref_dates():
+    """Read the reference dates and Section 1 spreads once per process.
+    
+    Only the workbook is opened; unlike ExcelMonitor no database session or
+    price tracking is set up. Returns empty RefDates if Excel is unavailable.
+    """
+    try:
+        excel = ExcelInterface()
+    except Exception:
+        print("\nWarning: Could not read actual spreads from Excel")
+        return RefDates()
+    
+    c_date = excel.read_cell(excel.sod_sheet, "C8")
+    three_m_date = excel.read_cell(excel.sod_sheet, "C9")
+    if c_date is None or three_m_date is None:
+        print("\nWarning: Could not read reference dates from SOD sheet")
+    
+    # Actual spreads from Section 1, read as one block
+    actual_spreads = set()
+    for date1, date2 in excel.read_range(excel.sheet, f"A{PRIMARY_ROWS.start}", len(PRIMARY_ROWS), 2):
+        if date1 and date2:
+            # Format dates consistently
+            if isinstance(date1, datetime):
+                date1 = _fmt_mmm_yy(date1)
+            if isinstance(date2, datetime):
+                date2 = _fmt_mmm_yy(date2)
+            actual_spreads.add((str(date1), str(date2)))
+    return RefDates(c_date, three_m_date, frozenset(actual_spreads))
 
 def show_recent_captures(minutes=5):
     """Show captures from the last N minutes."""
     session = Session()
-    monitor = None
     try:
         # Get captures from last N minutes
         since = datetime.utcnow() - timedelta(minutes=minutes)
-        captures = session.query(Snapshot).filter(
-            Snapshot.timestamp >= since,
-            (Snapshot.old_midpoint != Snapshot.new_midpoint) |  # Show if any price changed
-            (Snapshot.old_bid != Snapshot.new_bid) |
-            (Snapshot.old_ask != Snapshot.new_ask)
-        ).order_by(Snapshot.timestamp.asc()).all()  # Show oldest to newest
+        # Only the displayed columns are selected, so rows come back as plain tuples;
+        # SQLite formats the timestamp for display
+        captures = iter(session.execute(
+            select(func.strftime('%Y-%m-%d %H:%M:%S', Snapshot.timestamp).label('timestamp'),
+                   Snapshot.spread_name, Snapshot.prompt1, Snapshot.prompt2,
+                   Snapshot.old_midpoint, Snapshot.new_midpoint,
+                   Snapshot.old_bid, Snapshot.new_bid,
+                   Snapshot.old_ask, Snapshot.new_ask)
+            .where(Snapshot.timestamp >= since,
+                   PRICE_CHANGED)  # Show if any price changed; matches the partial index
+            .order_by(Snapshot.timestamp.asc())  # Show oldest to newest
+            .execution_options(yield_per=500)  # Fetched in batches
+        ))
         
-        if not captures:
+        first = next(captures, None)
+        if first is None:
             print(f"\nNo changes found in the last {minutes} minutes")
             return
             
         print(f"\nRecent changes (last {minutes} minutes):")
-        print("-" * 180)  # Increased width for more columns
-        print(f"Time                      | Type | A/D | Spread          | Days |"
-              f" Mid Old  | Mid New  |  Mid Δ  |"
-              f" Bid Old  | Bid New  |  Bid Δ  |"
-              f" Ask Old  | Ask New  |  Ask Δ")
-        print("-" * 180)
+        print(CHANGES_RULE)
+        print(CHANGES_HEADER)
+        print(CHANGES_RULE)
 
-        # Create and initialize monitor
-        monitor = ExcelMonitor()
-        monitor.connect_to_excel()  # Connect to Excel
-        monitor.update_reference_dates()  # Update reference dates
+        # Reference dates and Section 1 spreads, read from Excel once per process
+        refs = load_ref_dates()
+        actual_spreads = refs.actual_spreads
         
-        # Create a list to store all captures with their days
+        # Formatted rows with their days, for sorting
         all_captures = []
         
-        # First, build a set of actual spreads from Section 1 (rows 4-29)
-        actual_spreads = set()
-        if monitor and monitor.excel and monitor.excel.sheet:
-            try:
-                for row in range(4, 30):  # Rows 4-29 in Section 1
-                    date1 = monitor.excel.read_cell(monitor.excel.sheet, f"A{row}")
-                    date2 = monitor.excel.read_cell(monitor.excel.sheet, f"B{row}")
-                    if date1 and date2:
-                        # Format dates consistently
-                        if isinstance(date1, datetime):
-                            date1 = date1.strftime("%b-%y").upper()
-                        if isinstance(date2, datetime):
-                            date2 = date2.strftime("%b-%y").upper()
-                        actual_spreads.add((str(date1), str(date2)))
-            except:
-                print("\nWarning: Could not read actual spreads from Excel")
-        
-        for capture in captures:
+        total = 0
+        for capture in itertools.chain((first,), captures):
+            total += 1
             # Calculate changes
             mid_change = capture.new_midpoint - capture.old_midpoint
             bid_change = capture.new_bid - capture.old_bid if not math.isnan(capture.new_bid) and not math.isnan(capture.old_bid) else None
             ask_change = capture.new_ask - capture.old_ask if not math.isnan(capture.new_ask) and not math.isnan(capture.old_ask) else None
             
-            # Format change strings
-            mid_change_str = f"{capture.old_midpoint:9.2f} -> {capture.new_midpoint:9.2f} ({mid_change:+.2f})"
-            
-            # Format bid/ask strings - show gray "No Data" if no values or zeros
-            if math.isnan(capture.new_bid) or math.isnan(capture.old_bid) or (capture.new_bid == 0 and capture.old_bid == 0):
-                bid_change_str = color_text("                 No Data                 ", GRAY)
-            else:
-                bid_change_str = f"{capture.old_bid:12.2f} -> {capture.new_bid:12.2f} ({bid_change:+.2f})"
-                if bid_change > 0:
-                    bid_change_str = color_text(bid_change_str, GREEN)
-                elif bid_change < 0:
-                    bid_change_str = color_text(bid_change_str, RED)
-            
-            if math.isnan(capture.new_ask) or math.isnan(capture.old_ask) or (capture.new_ask == 0 and capture.old_ask == 0):
-                ask_change_str = color_text("                 No Data                 ", GRAY)
-            else:
-                ask_change_str = f"{capture.old_ask:12.2f} -> {capture.new_ask:12.2f} ({ask_change:+.2f})"
-                if ask_change > 0:
-                    ask_change_str = color_text(ask_change_str, GREEN)
-                elif ask_change < 0:
-                    ask_change_str = color_text(ask_change_str, RED)
-            
-            # Color the mid change
-            mid_change_str = f"{capture.old_midpoint:12.2f} -> {capture.new_midpoint:12.2f} ({mid_change:+.2f})"
-            if mid_change > 0:
-                mid_change_color = GREEN
-            elif mid_change < 0:
-                mid_change_color = RED
-            else:
-                mid_change_color = None
-            
-            # Format mid values
-            if mid_change > 0:
-                mid_change_str = color_text(mid_change_str, mid_change_color)
+            # Format mid change
+            mid_change_str = (POS_FMT if mid_change > 0 else NEG_FMT if mid_change < 0 else NEU_FMT).format(mid_change)
             
             # Format bid values
             if math.isnan(capture.old_bid) or math.isnan(capture.new_bid) or (capture.old_bid == 0 and capture.new_bid == 0):
-                bid_old_str = color_text("   N/A   ", GRAY)
-                bid_new_str = color_text("   N/A   ", GRAY)
-                bid_change_str = color_text("  N/A  ", GRAY)
+                bid_old_str = bid_new_str = NA_PRICE
+                bid_change_str = NA_CHANGE
             else:
                 bid_old_str = f"{capture.old_bid:10.2f}"
                 bid_new_str = f"{capture.new_bid:10.2f}"
-                bid_change_str = f"{bid_change:+8.2f}"
-                if bid_change > 0:
-                    bid_change_str = color_text(bid_change_str, GREEN)
-                elif bid_change < 0:
-                    bid_change_str = color_text(bid_change_str, RED)
+                bid_change_str = (POS_FMT if bid_change > 0 else NEG_FMT if bid_change < 0 else NEU_FMT).format(bid_change)
             
             # Format ask values
             if math.isnan(capture.old_ask) or math.isnan(capture.new_ask) or (capture.old_ask == 0 and capture.new_ask == 0):
-                ask_old_str = color_text("   N/A   ", GRAY)
-                ask_new_str = color_text("   N/A   ", GRAY)
-                ask_change_str = color_text("  N/A  ", GRAY)
+                ask_old_str = ask_new_str = NA_PRICE
+                ask_change_str = NA_CHANGE
             else:
                 ask_old_str = f"{capture.old_ask:10.2f}"
                 ask_new_str = f"{capture.new_ask:10.2f}"
-                ask_change_str = f"{ask_change:+8.2f}"
-                if ask_change > 0:
-                    ask_change_str = color_text(ask_change_str, GREEN)
-                elif ask_change < 0:
-                    ask_change_str = color_text(ask_change_str, RED)
+                ask_change_str = (POS_FMT if ask_change > 0 else NEG_FMT if ask_change < 0 else NEU_FMT).format(ask_change)
             
             # Calculate days between for the spread using stored prompts
             days = None
             if capture.prompt1 and capture.prompt2:  # Use stored prompts from database
-                if capture.prompt1 == 'C' and monitor.c_date:
-                    date1_obj = monitor.c_date
-                    date2_obj = get_prompt_date(capture.prompt2)
-                    if date2_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                elif capture.prompt1 == '3M' and monitor.three_m_date:
-                    date1_obj = monitor.three_m_date
-                    date2_obj = get_prompt_date(capture.prompt2)
-                    if date2_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                elif capture.prompt2 == '3M' and monitor.three_m_date:
-                    date1_obj = get_prompt_date(capture.prompt1)
-                    date2_obj = monitor.three_m_date
-                    if date1_obj:
-                        days = abs((date2_obj - date1_obj).days)
-                else:
-                    days = calculate_days_between(capture.prompt1, capture.prompt2)
+                days = refs.days_between(capture.prompt1, capture.prompt2)
             
             days_str = str(days) if days is not None else "N/A"
             
             # Determine if this is an actual spread by checking against our set
             spread_type = "A" if (str(capture.prompt1), str(capture.prompt2)) in actual_spreads else "D"
             
-            # Store all capture info for sorting
-            all_captures.append((
-                capture.timestamp,
-                capture.spread_name,
-                spread_type,
-                days,  # Store actual days for sorting
-                days_str,  # Store string version for display
-                mid_change_str,
-                bid_change_str,
-                ask_change_str
-            ))
+            # Store the finished row with its days for sorting
+            all_captures.append((days, ROW_FMT.format(
+                capture.timestamp, capture.spread_name, spread_type, days_str,
+                capture.old_midpoint, capture.new_midpoint, mid_change_str,
+                bid_old_str, bid_new_str, bid_change_str,
+                ask_old_str, ask_new_str, ask_change_str)))
         
-        # Sort all captures by days (None values go to the end)
-        all_captures.sort(key=lambda x: float('inf') if x[3] is None else x[3])
+        # Sort all captures by days (None values go to the end); the sort is
+        # stable, so captures with equal days stay oldest first
+        all_captures.sort(key=lambda x: float('inf') if x[0] is None else x[0])
         
-        # Print all captures in a single sorted section
-        for (timestamp, spread_name, spread_type, days, days_str, mid_change_str, bid_change_str, ask_change_str) in all_captures:
-            # Format mid values
-            if mid_change > 0:
-                mid_change_color = GREEN
-            elif mid_change < 0:
-                mid_change_color = RED
-            else:
-                mid_change_color = None
-            
-            # Format bid values
-            if math.isnan(capture.old_bid) or math.isnan(capture.new_bid) or (capture.old_bid == 0 and capture.new_bid == 0):
-                bid_old_str = color_text("   N/A   ", GRAY)
-                bid_new_str = color_text("   N/A   ", GRAY)
-                bid_change_str = color_text("  N/A  ", GRAY)
-            else:
-                bid_old_str = f"{capture.old_bid:10.2f}"
-                bid_new_str = f"{capture.new_bid:10.2f}"
-                bid_change_str = f"{bid_change:+8.2f}"
-                if bid_change > 0:
-                    bid_change_str = color_text(bid_change_str, GREEN)
-                elif bid_change < 0:
-                    bid_change_str = color_text(bid_change_str, RED)
-            
-            # Format ask values
-            if math.isnan(capture.old_ask) or math.isnan(capture.new_ask) or (capture.old_ask == 0 and capture.new_ask == 0):
-                ask_old_str = color_text("   N/A   ", GRAY)
-                ask_new_str = color_text("   N/A   ", GRAY)
-                ask_change_str = color_text("  N/A  ", GRAY)
-            else:
-                ask_old_str = f"{capture.old_ask:10.2f}"
-                ask_new_str = f"{capture.new_ask:10.2f}"
-                ask_change_str = f"{ask_change:+8.2f}"
-                if ask_change > 0:
-                    ask_change_str = color_text(ask_change_str, GREEN)
-                elif ask_change < 0:
-                    ask_change_str = color_text(ask_change_str, RED)
-            
-            print(f"{timestamp.strftime('%Y-%m-%d %H:%M:%S'):<25} | "
-                  f"{spread_name:<15} | "
-                  f"{spread_type:^3} | "
-                  f"{days_str:>4} | "
-                  f"{capture.old_midpoint:10.2f} | "
-                  f"{capture.new_midpoint:10.2f} | "
-                  f"{color_text(f'{mid_change:+8.2f}', mid_change_color) if mid_change_color else f'{mid_change:+8.2f}'} | "
-                  f"{bid_old_str} | {bid_new_str} | {bid_change_str} | "
-                  f"{ask_old_str} | {ask_new_str} | {ask_change_str}")
-            
-        print(f"\nTotal changes: {len(captures)}")
+        # Print all captures in a single sorted section, written out in one go
+        lines = [line for _, line in all_captures]
+        lines.append(f"\nTotal changes: {total}\n")
+        sys.stdout.write("\n".join(lines))
         
     finally:
         session.close()
         # Do not close the Excel application to keep the Excel file open for testing.
 
-def capture_with_stability(duration_minutes=None):
-    """Run continuous capture with stability checks."""
+def capture_with_stability(duration_minutes=None, quiet=False):
+    """Run continuous capture with stability checks.
+    
+    With `quiet` the per-capture changes table is not printed; changes are still recorded.
+    """
     start_time = datetime.now()
     monitor = ExcelMonitor()
+    monitor.verbose = not quiet
     
     print(f"\nStarting live price monitoring at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Stability required: {STABILITY_DURATION} seconds")
@@ -1139,23 +1387,64 @@ def capture_with_stability(duration_minutes=None):
     print_full_snapshot(monitor, start_time)
     
     print("\nMonitoring for changes:")
-    print(f"Time                      | Type | A/D | Spread          | Days |"
-          f" Mid Old  | Mid New  |  Mid Δ  |"
-          f" Bid Old  | Bid New  |  Bid Δ  |"
-          f" Ask Old  | Ask New  |  Ask Δ")
-    print("-" * 180)  # Increased width to accommodate wider columns
+    print(CHANGES_HEADER)
+    print(CHANGES_RULE)
+    
+    # Commit captured rows from a background thread so writes never delay a poll
+    monitor.writer = SnapshotWriter()
+    
+    # Wake early when Excel reports a change instead of always sleeping a full poll
+    wake = threading.Event()
+    watching = bool(monitor.excel) and monitor.excel.watch_changes(wake.set)
+    changed = True
+    idle_skips = 0
+    
+    # Poll at POLL_INTERVAL while prices move, backing off towards
+    # MAX_POLL_INTERVAL while nothing in the sheet changes
+    poll_interval = POLL_INTERVAL
+    
+    # Run time is measured on the monotonic clock so wall-clock changes can't cut it short
+    deadline = time.monotonic() + duration_minutes * 60 if duration_minutes else None
+    
+    # Ctrl+C stops the loop at once, even mid-wait, and lets it shut down cleanly
+    stop = threading.Event()
+    def handle_interrupt(signum, frame):  # pylint: disable=unused-argument
+        stop.set()
+        wake.set()
+    previous_handler = signal.signal(signal.SIGINT, handle_interrupt)
     
     try:
-        while True:
-            if duration_minutes and (datetime.now() - start_time).total_seconds() > duration_minutes * 60:
+        while not stop.is_set():
+            if deadline is not None and time.monotonic() > deadline:
                 break
             
-            monitor.capture_midpoints()  # Only prints when changes occur
-            time.sleep(POLL_INTERVAL)
+            # With change events, a quiet sheet with nothing left to settle
+            # needs no read; still read every so often in case an event was missed
+            if (watching and not changed and not monitor.last_active_rows
+                    and idle_skips < IDLE_FULL_READ_EVERY):
+                idle_skips += 1
+            else:
+                monitor.capture_midpoints()  # Only prints when changes occur
+                idle_skips = 0
+            if monitor.last_active_rows:
+                poll_interval = POLL_INTERVAL
+            else:
+                poll_interval = min(poll_interval * POLL_BACKOFF, MAX_POLL_INTERVAL)
             
-    except KeyboardInterrupt:
-        print("\nMonitoring stopped by user")
+            if monitor.excel:
+                changed = monitor.excel.wait_for_change(wake, poll_interval)
+            else:
+                wake.wait(poll_interval)
+                wake.clear()
+        
+        if stop.is_set():
+            print("\nMonitoring stopped by user")
     finally:
+        signal.signal(signal.SIGINT, previous_handler)
+        if watching:
+            monitor.excel.unwatch_changes()
+        monitor.flush_snapshots()  # Don't lose rows still waiting for a full batch
+        monitor.writer.close()
         monitor.session.close()
         
     # Show what was captured
@@ -1166,14 +1455,21 @@ def capture_with_stability(duration_minutes=None):
 
 if __name__ == '__main__':
     # Initialize the database engine here
+    from market_maker.config.settings import DB_PATH
     from market_maker.data.models import init_db
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     engine = init_db()
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        engine.dispose()  # Reopen pooled connections so they pick up the pragmas
+    ensure_indexes(engine)
 
     # Parse command-line arguments (if any) and run the capture process
     parser = argparse.ArgumentParser(description='Manual capture of Excel data with stability checks')
     # Add additional arguments as needed
     parser.add_argument('--minutes', type=int, default=None, help='Duration in minutes for capturing data')
+    parser.add_argument('--quiet', action='store_true', help='Record changes without printing them as they are captured')
     args = parser.parse_args()
 
     # Call the appropriate capture function. For example, if capture_with_stability() is defined:
-    capture_with_stability(duration_minutes=args.minutes) 
\ No newline at end of file
+    capture_with_stability(duration_minutes=args.minutes, quiet=args.quiet) 
\ No newline at end of file
@@ -2,11 +2,15 @@
 Script to populate the database with mock data for testing.
 """
 from datetime import datetime, timedelta
+from sqlalchemy import insert
+from market_maker.config.settings import DB_PATH
 from market_maker.data.models import Session, Snapshot
+from market_maker.utils.db_indexes import ensure_indexes
 
 def populate_mock_data():
     """Populate database with mock data."""
     session = Session()
+    ensure_indexes(session.get_bind())
     now = datetime.utcnow()
     
     # Create mock data for different spreads
@@ -37,29 +41,38 @@ def populate_mock_data():
         }
     ]
     
+    # Rows are collected as plain dicts and written with one bulk insert
+    rows = []
+    
+    # Unpack each spread's fields once rather than per row
+    spread_fields = [(spread['name'], spread['prompt1'], spread['prompt2'],
+                      spread['base_mid'], spread['base_bid'], spread['base_ask'])
+                     for spread in spreads]
+    
     # Create snapshots over the last 24 hours
     for hours_ago in range(24):
         for minutes in range(0, 60, 5):  # Every 5 minutes
             timestamp = now - timedelta(hours=hours_ago, minutes=minutes)
+            # Add some random-like price movement, shared by every spread at this time
+            movement = (hours_ago + minutes/60) * 0.01
             
             # Create snapshots for each spread
-            for spread in spreads:
-                # Add some random-like price movement
-                movement = (hours_ago + minutes/60) * 0.01
-                
-                snapshot = Snapshot(
-                    timestamp=timestamp,
-                    spread_name=spread['name'],
-                    prompt1=spread['prompt1'],
-                    prompt2=spread['prompt2'],
-                    old_midpoint=spread['base_mid'] + movement,
-                    new_midpoint=spread['base_mid'] + movement + 0.02,
-                    old_bid=spread['base_bid'] + movement,
-                    new_bid=spread['base_bid'] + movement + 0.02,
-                    old_ask=spread['base_ask'] + movement,
-                    new_ask=spread['base_ask'] + movement + 0.02
-                )
-                session.add(snapshot)
+            for name, prompt1, prompt2, base_mid, base_bid, base_ask in spread_fields:
+                old_mid = base_mid + movement
+                old_bid = base_bid + movement
+                old_ask = base_ask + movement
+                rows.append({
+                    'timestamp': timestamp,
+                    'spread_name': name,
+                    'prompt1': prompt1,
+                    'prompt2': prompt2,
+                    'old_midpoint': old_mid,
+                    'new_midpoint': old_mid + 0.02,
+                    'old_bid': old_bid,
+                    'new_bid': old_bid + 0.02,
+                    'old_ask': old_ask,
+                    'new_ask': old_ask + 0.02
+                })
     
     # Add some larger price moves for testing
     big_moves = [
@@ -70,24 +83,26 @@ def populate_mock_data():
     
     for move, spread_name in big_moves:
         spread = next(s for s in spreads if s['name'] == spread_name)
-        snapshot = Snapshot(
-            timestamp=now - timedelta(hours=2),
-            spread_name=spread_name,
-            prompt1=spread['prompt1'],
-            prompt2=spread['prompt2'],
-            old_midpoint=spread['base_mid'],
-            new_midpoint=spread['base_mid'] + move,
-            old_bid=spread['base_bid'],
-            new_bid=spread['base_bid'] + move,
-            old_ask=spread['base_ask'],
-            new_ask=spread['base_ask'] + move
-        )
-        session.add(snapshot)
+        rows.append({
+            'timestamp': now - timedelta(hours=2),
+            'spread_name': spread_name,
+            'prompt1': spread['prompt1'],
+            'prompt2': spread['prompt2'],
+            'old_midpoint': spread['base_mid'],
+            'new_midpoint': spread['base_mid'] + move,
+            'old_bid': spread['base_bid'],
+            'new_bid': spread['base_bid'] + move,
+            'old_ask': spread['base_ask'],
+            'new_ask': spread['base_ask'] + move
+        })
     
+    # One executemany in a single transaction instead of an ORM object per row
+    session.execute(insert(Snapshot), rows)
     session.commit()
     session.close()
     
     print("Mock data populated successfully!")
 
 if __name__ == '__main__':
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     populate_mock_data() 
\ No newline at end of file
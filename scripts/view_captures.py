@@ -1,6 +1,7 @@
 """
 Script to view recent captures from the database.
 """
+from sqlalchemy import select
 from market_maker.data.models import Session, Snapshot
 from datetime import datetime, timedelta
 import argparse
@@ -9,30 +10,38 @@ def show_recent_captures(minutes=5):
     """Show captures from the last N minutes."""
     session = Session()
     try:
-        # Get captures from last N minutes
+        # Get captures from last N minutes; only the displayed columns are
+        # selected and rows are streamed in batches rather than loaded at once
         since = datetime.utcnow() - timedelta(minutes=minutes)
-        captures = session.query(Snapshot).filter(
+        query = select(
+            Snapshot.timestamp,
+            Snapshot.spread_name,
+            Snapshot.old_midpoint,
+            Snapshot.new_midpoint
+        ).where(
             Snapshot.timestamp >= since
-        ).order_by(Snapshot.timestamp.desc()).all()
+        ).order_by(Snapshot.timestamp.desc()).execution_options(yield_per=1000)
+        captures = session.execute(query)
         
-        if not captures:
+        total = 0
+        for timestamp, spread_name, old_mid, new_mid in captures:
+            if not total:
+                print(f"\nRecent captures (last {minutes} minutes):")
+                print("-" * 100)
+                print(f"{'Timestamp':<20} | {'Spread':<15} | {'Old Mid':>9} | {'New Mid':>9} | {'Change':>9}")
+                print("-" * 100)
+            total += 1
+            print(f"{timestamp.strftime('%H:%M:%S'):<20} | "
+                  f"{spread_name:<15} | "
+                  f"{old_mid:9.2f} | "
+                  f"{new_mid:9.2f} | "
+                  f"{new_mid - old_mid:+9.2f}")
+        
+        if not total:
             print(f"\nNo captures found in the last {minutes} minutes")
             return
             
-        print(f"\nRecent captures (last {minutes} minutes):")
-        print("-" * 100)
-        print(f"{'Timestamp':<20} | {'Spread':<15} | {'Old Mid':>9} | {'New Mid':>9} | {'Change':>9}")
-        print("-" * 100)
-        
-        for capture in captures:
-            change = capture.new_midpoint - capture.old_midpoint
-            print(f"{capture.timestamp.strftime('%H:%M:%S'):<20} | "
-                  f"{capture.spread_name:<15} | "
-                  f"{capture.old_midpoint:9.2f} | "
-                  f"{capture.new_midpoint:9.2f} | "
-                  f"{change:+9.2f}")
-            
-        print(f"\nTotal captures: {len(captures)}")
+        print(f"\nTotal captures: {total}")
         
     finally:
         session.close()
@@ -22,8 +22,6 @@ setup(
         "xlwings;platform_system=='Darwin'",  # Mac only
         "pywin32;platform_system=='Windows'",  # Windows only
         "pytest",
-        "freezegun",
-        "schedule",
         "openpyxl",
         "click"
     ],
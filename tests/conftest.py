@@ -11,14 +11,23 @@ from pathlib import Path
 
 import pandas as pd
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from market_maker.data.models import Base, Snapshot
+from market_maker.utils.db_indexes import ensure_indexes
 
 # Test database path
 TEST_DB_PATH = Path(__file__).parent / "test_data/test.db"
 
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Use WAL without a full fsync per commit on every test connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
 @pytest.fixture(scope="session")
 def test_db_engine():
     """Create a test database engine."""
@@ -27,11 +36,14 @@ def test_db_engine():
 
     # Create test database
     engine = create_engine(f"sqlite:///{TEST_DB_PATH}")
+    event.listen(engine, "connect", _set_sqlite_pragmas)
     Base.metadata.create_all(engine)
+    ensure_indexes(engine)
 
     yield engine
 
     # Cleanup
+    engine.dispose()
     if TEST_DB_PATH.exists():
         TEST_DB_PATH.unlink()
 
@@ -41,14 +53,14 @@ def db_session(test_db_engine):
     session_factory = sessionmaker(bind=test_db_engine)
     session = session_factory()
 
-    # Clean up any existing data before test
-    session.query(Snapshot).delete()
+    # Clean up any existing data before test; a Core DELETE skips the ORM
+    session.execute(Snapshot.__table__.delete())
     session.commit()
 
     yield session
 
     # Clean up all data and close session after test
-    session.query(Snapshot).delete()
+    session.execute(Snapshot.__table__.delete())
     session.commit()
     session.close()
 
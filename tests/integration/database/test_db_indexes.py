@@ -0,0 +1,74 @@
+"""
+Tests that the monitoring queries are served by the snapshot indexes.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert
+
+from market_maker.data.models import Snapshot
+from market_maker.utils.db_monitor import DatabaseMonitor
+
+@pytest.fixture
+def spread_snapshots(db_session):
+    """Insert snapshots for three spreads with distinct midpoint changes."""
+    now = datetime.utcnow()
+    rows = [
+        {
+            'timestamp': now - timedelta(minutes=i),
+            'spread_name': name,
+            'prompt1': name[:5],
+            'prompt2': name[6:],
+            'old_midpoint': 100.0,
+            'new_midpoint': 100.0 + (i * 7 + offset) % 13 - 6,
+            'old_bid': 99.5,
+            'new_bid': 99.5,
+            'old_ask': 100.5,
+            'new_ask': 100.5
+        }
+        for offset, name in enumerate(["JUL24-AUG24", "AUG24-SEP24", "SEP24-OCT24"])
+        for i in range(20)
+    ]
+    db_session.execute(insert(Snapshot), rows)
+    db_session.commit()
+    return rows
+
+@pytest.fixture
+def query_plan(test_db_engine, db_session):
+    """Run a monitor call and return the EXPLAIN QUERY PLAN of its SELECT."""
+    def explain(call):
+        statements = []
+
+        def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(test_db_engine, "before_cursor_execute", capture)
+        try:
+            result = call(DatabaseMonitor(session=db_session))
+        finally:
+            event.remove(test_db_engine, "before_cursor_execute", capture)
+
+        statement, parameters = statements[-1]
+        with test_db_engine.connect() as conn:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        return result, " | ".join(row[-1] for row in plan)
+    return explain
+
+def test_spread_history_uses_spread_timestamp_index(spread_snapshots, query_plan):
+    """Test that a spread's history is a range search on (spread_name, timestamp)."""
+    history, plan = query_plan(lambda monitor: monitor.get_spread_history("JUL24-AUG24", hours=1))
+
+    assert len(history) == 20
+    assert "ix_snapshots_spread_timestamp" in plan
+
+def test_largest_moves_read_from_midpoint_change_index(spread_snapshots, query_plan):
+    """Test that the largest moves come from the change index without a sort."""
+    moves, plan = query_plan(lambda monitor: monitor.get_largest_moves(top_n=5))
+
+    expected = sorted((row['new_midpoint'] - row['old_midpoint'] for row in spread_snapshots),
+                      reverse=True)[:5]
+    assert moves['change'].tolist() == expected
+    assert (moves['new_mid'] - moves['old_mid']).tolist() == expected
+    assert "ix_snapshots_midpoint_change" in plan
+    assert "TEMP B-TREE" not in plan
@@ -4,6 +4,7 @@ Tests for the database monitoring functionality.
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import insert
 
 from market_maker.data.models import Snapshot
 from market_maker.utils.db_monitor import DatabaseMonitor
@@ -16,42 +17,42 @@ def sample_snapshots(db_session):
     - 10 snapshots for JUL24-AUG24 spread
     - 5 snapshots for SEP24-OCT24 spread
     Each snapshot has incrementing prices and decreasing timestamps.
+    Rows are returned as the dicts that were inserted.
     """
     now = datetime.utcnow()
     snapshots = [
-        Snapshot(
-            timestamp=now - timedelta(minutes=i),
-            spread_name="JUL24-AUG24",
-            prompt1="JUL24",
-            prompt2="AUG24",
-            old_midpoint=100.0 + i,
-            new_midpoint=101.0 + i,
-            old_bid=99.5 + i,
-            new_bid=100.5 + i,
-            old_ask=100.5 + i,
-            new_ask=101.5 + i
-        ) for i in range(10)
+        {
+            'timestamp': now - timedelta(minutes=i),
+            'spread_name': "JUL24-AUG24",
+            'prompt1': "JUL24",
+            'prompt2': "AUG24",
+            'old_midpoint': 100.0 + i,
+            'new_midpoint': 101.0 + i,
+            'old_bid': 99.5 + i,
+            'new_bid': 100.5 + i,
+            'old_ask': 100.5 + i,
+            'new_ask': 101.5 + i
+        } for i in range(10)
     ]
 
     # Add some data for a different spread
     snapshots.extend([
-        Snapshot(
-            timestamp=now - timedelta(minutes=i),
-            spread_name="SEP24-OCT24",
-            prompt1="SEP24",
-            prompt2="OCT24",
-            old_midpoint=200.0 + i,
-            new_midpoint=201.0 + i,
-            old_bid=199.5 + i,
-            new_bid=200.5 + i,
-            old_ask=200.5 + i,
-            new_ask=201.5 + i
-        ) for i in range(5)
+        {
+            'timestamp': now - timedelta(minutes=i),
+            'spread_name': "SEP24-OCT24",
+            'prompt1': "SEP24",
+            'prompt2': "OCT24",
+            'old_midpoint': 200.0 + i,
+            'new_midpoint': 201.0 + i,
+            'old_bid': 199.5 + i,
+            'new_bid': 200.5 + i,
+            'old_ask': 200.5 + i,
+            'new_ask': 201.5 + i
+        } for i in range(5)
     ])
 
-    # Add to database
-    for snapshot in snapshots:
-        db_session.add(snapshot)
+    # Add to database with a single bulk insert
+    db_session.execute(insert(Snapshot), snapshots)
     db_session.commit()
 
     return snapshots
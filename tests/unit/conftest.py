@@ -0,0 +1,28 @@
+"""
+Fixtures shared by the unit tests.
+"""
+from datetime import datetime
+
+import pytest
+
+@pytest.fixture
+def frozen_now(monkeypatch, request):
+    """Freeze datetime.now() in time_utils at the test's `frozen` marker time.
+
+    Only the module under test is patched, so unlike freezegun this does not
+    scan every loaded module for datetime references on each test.
+
+    Example:
+        @pytest.mark.frozen("2024-03-20 08:30:00")
+        def test_something(self, frozen_now): ...
+    """
+    frozen = datetime.fromisoformat(request.node.get_closest_marker("frozen").args[0])
+
+    class FrozenDatetime(datetime):
+        """datetime whose now() always returns the frozen (UTC) time."""
+        @classmethod
+        def now(cls, tz=None):
+            return frozen if tz is None else tz.fromutc(frozen.replace(tzinfo=tz))
+
+    monkeypatch.setattr("market_maker.utils.time_utils.datetime", FrozenDatetime)
+    return frozen
@@ -0,0 +1,47 @@
+"""
+Tests for DataFrame text output.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+from market_maker.utils.df_output import write_df
+
+def _write(df, **kwargs):
+    stream = io.StringIO()
+    write_df(df, stream, **kwargs)
+    return stream.getvalue().splitlines()
+
+class TestWriteDf:
+    """Test suite for the fixed-width DataFrame writer."""
+
+    def test_columns_align_across_chunks(self):
+        """Test that rows in every chunk line up under the single header."""
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(['2024-03-20 08:30:00.123456', '2024-03-20 08:31:00.000000'] * 6),
+            'spread': ['A', 'JUL24-AUG24'] * 6,
+            'change': [1.123456789, np.nan] * 6,
+        })
+        lines = _write(df, chunk=5)
+
+        assert len(lines) == 13
+        assert lines[0].split() == ['timestamp', 'spread', 'change']
+        assert len({len(line) for line in lines}) == 1
+        for column in ('timestamp', 'spread', 'change'):
+            end = lines[0].index(column) + len(column)
+            assert all(line[end - 1] != ' ' and (end == len(line) or line[end] == ' ') for line in lines[1:])
+
+    def test_floats_follow_display_precision(self):
+        """Test that floats are rounded to display.precision and the index is kept."""
+        df = pd.DataFrame({'mid': [1.123456789, np.nan]}, index=[7, 10])
+        lines = _write(df)
+
+        assert lines[1].split() == ['7', '1.123457']
+        assert lines[2].split() == ['10', 'NaN']
+        with pd.option_context('display.precision', 9):
+            assert _write(df)[1].split() == ['7', '1.123456789']
+
+    def test_empty_frame_writes_header(self):
+        """Test that an empty frame still writes its header."""
+        assert _write(pd.DataFrame({'spread': []})) == ['  spread']
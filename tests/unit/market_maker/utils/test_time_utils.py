@@ -3,19 +3,20 @@ Tests for time-related utility functions.
 """
 from datetime import datetime, time
 
-from freezegun import freeze_time
+import pytest
 
 from market_maker.utils.time_utils import (
     format_timestamp,
     is_trading_hours,
     parse_time,
+    seconds_until,
 )
 
 class TestTimeUtils:
     """Test suite for time utility functions.
 
     Tests time parsing, formatting, and trading hours validation
-    with various edge cases using freezegun for time manipulation.
+    with various edge cases, freezing the current time with the frozen_now fixture.
     """
     def test_parse_time(self):
         """Test parsing time strings."""
@@ -28,21 +29,31 @@ class TestTimeUtils:
         assert parsed.hour == 16
         assert parsed.minute == 0
 
-    @freeze_time("2024-03-20 08:30:00")
-    def test_is_trading_hours_during_trading(self):
+    @pytest.mark.frozen("2024-03-20 08:30:00")
+    def test_is_trading_hours_during_trading(self, frozen_now):
         """Test trading hours check during trading time."""
         assert is_trading_hours() is True
 
-    @freeze_time("2024-03-20 06:59:59")
-    def test_is_trading_hours_before_trading(self):
+    @pytest.mark.frozen("2024-03-20 06:59:59")
+    def test_is_trading_hours_before_trading(self, frozen_now):
         """Test trading hours check before trading starts."""
         assert is_trading_hours() is False
 
-    @freeze_time("2024-03-20 16:00:01")
-    def test_is_trading_hours_after_trading(self):
+    @pytest.mark.frozen("2024-03-20 16:00:01")
+    def test_is_trading_hours_after_trading(self, frozen_now):
         """Test trading hours check after trading ends."""
         assert is_trading_hours() is False
 
+    @pytest.mark.frozen("2024-03-20 06:00:00")
+    def test_seconds_until_later_today(self, frozen_now):
+        """Test seconds until a time later the same day."""
+        assert seconds_until("07:00") == 3600
+
+    @pytest.mark.frozen("2024-03-20 16:30:00")
+    def test_seconds_until_rolls_over_midnight(self, frozen_now):
+        """Test seconds until a time that has already passed today."""
+        assert seconds_until("07:00") == 14.5 * 3600
+
     def test_format_timestamp(self):
         """Test timestamp formatting."""
         dt = datetime(2024, 3, 20, 14, 30, 45)
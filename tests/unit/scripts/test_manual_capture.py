@@ -0,0 +1,57 @@
+"""
+Tests for the manual capture script's Excel block reads.
+"""
+import pytest
+
+from scripts import manual_capture
+from scripts.manual_capture import ExcelInterface, is_valid_spread
+
+class _FakeRange:
+    """Stands in for an xlwings Range returning a fixed 2-D block."""
+
+    def __init__(self, values):
+        self.value = values
+
+    def options(self, ndim):
+        return self
+
+class _FakeSheet:
+    """Stands in for an xlwings sheet, counting Range objects created."""
+
+    def __init__(self, values):
+        self.values = values
+        self.ranges_created = 0
+
+    def range(self, address):
+        self.ranges_created += 1
+        return _FakeRange(self.values)
+
+@pytest.fixture
+def excel(monkeypatch):
+    """An ExcelInterface on the xlwings path without connecting to Excel."""
+    monkeypatch.setattr(manual_capture, 'IS_WINDOWS', False)
+    interface = ExcelInterface.__new__(ExcelInterface)
+    interface._ranges = {}
+    return interface
+
+class TestReadRange:
+    """Test suite for ExcelInterface.read_range on the xlwings path."""
+
+    def test_empty_mid_is_none_and_skipped(self, excel):
+        """Test that an empty mid cell reads as None and fails spread validation."""
+        sheet = _FakeSheet([["JUL24", "AUG24", None], ["AUG24", "SEP24", 1.5]])
+        rows = excel.read_range(sheet, "A4", 2, 3)
+
+        assert rows[0][2] is None
+        assert not is_valid_spread(*rows[0])
+
+    def test_range_reused_per_sheet(self, excel):
+        """Test that the Range is created once per sheet and block, and kept per sheet."""
+        first = _FakeSheet([[1.0]])
+        excel.read_range(first, "C4", 1, 1)
+        excel.read_range(first, "C4", 1, 1)
+        assert first.ranges_created == 1
+
+        second = _FakeSheet([[2.0]])
+        assert excel.read_range(second, "C4", 1, 1) == [[2.0]]
+        assert second.ranges_created == 1
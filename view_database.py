@@ -3,10 +3,11 @@
 Script to view the contents of the market maker database.
 Provides easy-to-use functions to view recent changes, statistics, and spread history.
 """
+import sys
 from datetime import datetime, timedelta
-import pandas as pd
 from market_maker.data.models import Session, Snapshot
 from market_maker.utils.db_decorator import with_monitor
+from market_maker.utils.df_output import write_df
 
 @with_monitor
 def show_stats(monitor):
@@ -20,14 +21,18 @@ def show_stats(monitor):
 @with_monitor
 def show_recent(monitor, minutes=5):
     """Show recent price changes."""
-    snapshots = monitor.get_recent_snapshots(minutes=minutes)
+    snapshots = monitor.iter_recent_snapshots(
+        minutes=minutes,
+        columns=('timestamp', 'spread_name', 'old_midpoint', 'new_midpoint'))
     print(f"\nRecent Changes (last {minutes} minutes):")
     print("----------------------------------------")
-    for snap in snapshots:
-        change = snap.new_midpoint - snap.old_midpoint
-        print(f"Time: {snap.timestamp}, Spread: {snap.spread_name:15}, "
-              f"Mid: {snap.old_midpoint:7.2f} -> {snap.new_midpoint:7.2f} "
-              f"(Δ: {change:+6.2f})")
+    # Rows are formatted as they stream in and written through stdout's buffer
+    sys.stdout.writelines(
+        f"Time: {timestamp}, Spread: {spread_name:15}, "
+        f"Mid: {old_mid:7.2f} -> {new_mid:7.2f} "
+        f"(Δ: {new_mid - old_mid:+6.2f})\n"
+        for timestamp, spread_name, old_mid, new_mid in snapshots
+    )
 
 @with_monitor
 def show_spread_history(monitor, spread_name, hours=24):
@@ -38,7 +43,7 @@ def show_spread_history(monitor, spread_name, hours=24):
         return
     print(f"\nPrice History for {spread_name} (last {hours} hours):")
     print("------------------------------------------------")
-    print(df.to_string())
+    write_df(df)
 
 @with_monitor
 def show_largest_moves(monitor, top_n=10):
@@ -49,7 +54,7 @@ def show_largest_moves(monitor, top_n=10):
         return
     print(f"\nTop {top_n} Largest Price Moves:")
     print("---------------------------")
-    print(df.to_string())
+    write_df(df)
 
 @with_monitor
 def show_spread_summary(monitor, hours=24):
@@ -60,45 +65,42 @@ def show_spread_summary(monitor, hours=24):
         return
     print(f"\nSpread Activity Summary (last {hours} hours):")
     print("----------------------------------------")
-    print(df.to_string())
+    write_df(df)
+
+# Command name -> (function, positional arguments, description). Each argument is
+# (label, type, default); a default of None marks it as required
+COMMANDS = {
+    "stats": (show_stats, (), "Show database statistics"),
+    "recent": (show_recent, (("minutes", int, 5),), "Show recent changes"),
+    "history": (show_spread_history, (("SPREAD", str, None), ("hours", int, 24)), "Show spread history"),
+    "moves": (show_largest_moves, (("top_n", int, 10),), "Show largest moves"),
+    "summary": (show_spread_summary, (("hours", int, 24),), "Show spread summary"),
+}
+# How a missing required argument is named in the error message
+REQUIRED_ARG_NAMES = {"SPREAD": "a spread name"}
 
 if __name__ == "__main__":
-    import sys
-    
-    # Set pandas display options for better output
-    pd.set_option('display.max_rows', None)
-    pd.set_option('display.max_columns', None)
-    pd.set_option('display.width', None)
-    
     if len(sys.argv) < 2:
         print("\nUsage:")
-        print("  python view_database.py stats              - Show database statistics")
-        print("  python view_database.py recent [minutes]   - Show recent changes")
-        print("  python view_database.py history SPREAD [hours] - Show spread history")
-        print("  python view_database.py moves [top_n]      - Show largest moves")
-        print("  python view_database.py summary [hours]    - Show spread summary")
+        for name, (_, args, description) in COMMANDS.items():
+            usage = " ".join([name] + [label if default is None else f"[{label}]"
+                                       for label, _, default in args])
+            print(f"  python view_database.py {usage:<18} - {description}")
         sys.exit(1)
     
     command = sys.argv[1]
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}")
+        sys.exit(1)
     
-    if command == "stats":
-        show_stats()
-    elif command == "recent":
-        minutes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
-        show_recent(minutes)
-    elif command == "history":
-        if len(sys.argv) < 3:
-            print("Error: Please specify a spread name")
+    func, args, _ = COMMANDS[command]
+    values = []
+    for position, (label, convert, default) in enumerate(args, start=2):
+        if len(sys.argv) > position:
+            values.append(convert(sys.argv[position]))
+        elif default is None:
+            print(f"Error: Please specify {REQUIRED_ARG_NAMES.get(label, label)}")
             sys.exit(1)
-        spread = sys.argv[2]
-        hours = int(sys.argv[3]) if len(sys.argv) > 3 else 24
-        show_spread_history(spread, hours)
-    elif command == "moves":
-        top_n = int(sys.argv[2]) if len(sys.argv) > 2 else 10
-        show_largest_moves(top_n)
-    elif command == "summary":
-        hours = int(sys.argv[2]) if len(sys.argv) > 2 else 24
-        show_spread_summary(hours)
-    else:
-        print(f"Unknown command: {command}")
-        sys.exit(1) 
\ No newline at end of file
+        else:
+            values.append(default)
+    func(*values)
\ No newline at end of file